@@ -0,0 +1,28 @@
+# scripts/build_action_manifest.py
+
+"""
+Regenerate src/mssqlclient_ng/core/actions/_manifest.json.
+
+ActionFactory reads this manifest to list, search and describe actions without
+importing them. Run after adding, renaming or re-describing an action:
+
+    uv run python scripts/build_action_manifest.py
+"""
+
+# Built-in imports
+import json
+
+# Local library imports
+from mssqlclient_ng.core.actions.factory import ActionFactory
+
+
+def main() -> None:
+    manifest = ActionFactory.build_manifest()
+    ActionFactory.MANIFEST_PATH.write_text(
+        json.dumps(manifest, indent=2, ensure_ascii=False) + "\n", encoding="utf-8"
+    )
+    print(f"Wrote {len(manifest)} actions to {ActionFactory.MANIFEST_PATH}")
+
+
+if __name__ == "__main__":
+    main()
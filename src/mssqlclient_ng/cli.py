@@ -2,6 +2,7 @@
 
 # Built-in imports
 import argparse
+import functools
 import os
 import shlex
 import sys
@@ -12,18 +13,7 @@ from loguru import logger
 
 # Local library imports
 from . import __version__, banner
-from .core.models import server
-from .core.models.linked_servers import LinkedServers
-from .core.services.authentication import AuthenticationService
-from .core.services.database import DatabaseContext
-from .core.terminal import Terminal
-from .core.utils import logbook
-from .core.utils.formatters import OutputFormatter
-
-# Import actions package to trigger @ActionFactory.register() decorators
-from .core import actions  # noqa: F401
 from .core.actions.factory import ActionFactory
-from .core.actions.execution import query
 
 def _log_identity(server_name: str, system_user: str, mapped_user: str) -> None:
     if mapped_user and mapped_user != system_user:
@@ -32,7 +22,14 @@ def _log_identity(server_name: str, system_user: str, mapped_user: str) -> None:
         logger.info(f"Logged in on {server_name} as {system_user}")
 
 
+@functools.cache
 def build_parser() -> argparse.ArgumentParser:
+    """
+    Build the command line parser.
+
+    The parser is built once per process and reused: it holds no per-run
+    state, and main() may be called repeatedly when embedded.
+    """
 
     parser = argparse.ArgumentParser(
         prog="mssqlclient-ng",
@@ -270,34 +267,200 @@ def build_parser() -> argparse.ArgumentParser:
 
     return parser
 
+
+# Options that take a value, mapped to their argparse nargs (None for exactly
+# one value). split_action_argv() runs before any parser is built, so this is
+# kept next to build_parser() rather than read back from it; a test keeps the
+# two in step.
+VALUE_OPTIONS: dict[str, str | None] = {
+    "-d": None,
+    "--domain": None,
+    "-u": None,
+    "--username": None,
+    "-p": None,
+    "--password": None,
+    "-H": None,
+    "--hashes": None,
+    "--aesKey": "+",
+    "--kdcHost": None,
+    "-db": None,
+    "--database": None,
+    "-l": None,
+    "--links": None,
+    "-ntlmchallenge": None,
+    "-t": None,
+    "--timeout": None,
+    "-dc-ip": None,
+    "-target-ip": None,
+    "--workstation-id": None,
+    "--app-name": None,
+    "--client-interface-name": None,
+    "-q": None,
+    "--query": None,
+    "-o": None,
+    "--output-format": None,
+    "--prefix": None,
+    "--log-level": None,
+    "--std": None,
+}
+
+
+def _value_option(token: str) -> str | None:
+    """
+    Return the option string a token names when that option expects a value.
+
+    Mirrors argparse's lookup: exact option strings first, then unambiguous
+    abbreviations of long options. Tokens that already carry their value
+    ("--password=x") do not consume the next token and return None.
+    """
+    if "=" in token:
+        return None
+
+    if token in VALUE_OPTIONS:
+        return token
+
+    if token.startswith("--") and len(token) > 2:
+        matches = [option for option in VALUE_OPTIONS if option.startswith(token)]
+        if len(matches) == 1:
+            return matches[0]
+
+    return None
+
+
+def _action_tokens(token: str) -> list[str] | None:
+    """
+    Return the action tokens a -a/--action flag carries inline.
+
+    Handles every spelling argparse accepts for the flag: "-a", "-ainfo",
+    "-a=info", "--action", "--action=info" and their long abbreviations
+    ("--act", "--act=info"). Returns an empty list for a bare flag and None
+    when the token is not the action flag at all.
+    """
+    if token.startswith("--"):
+        name, equals, value = token.partition("=")
+        if len(name) >= 4 and "--action".startswith(name):
+            return [value] if equals else []
+        return None
+
+    if token.startswith("-a"):
+        value = token[2:]
+        if value.startswith("="):
+            value = value[1:]
+        return [value] if value else []
+
+    return None
+
+
+def split_action_argv(argv: list[str]) -> tuple[list[str], list[str] | None]:
+    """
+    Split the command line at the first -a/--action flag.
+
+    Everything after the flag belongs to the action and is returned verbatim,
+    so argparse never has to walk those tokens as a REMAINDER. A token that is
+    the value of the preceding option (e.g. the password in "-p -a") is not a
+    flag; such dash-leading values are rejoined as "-p=-a" so argparse reads
+    them as values too.
+
+    Args:
+        argv: Command line arguments, without the program name
+
+    Returns:
+        tuple of (arguments for the main parser, action tokens or None when no
+        action flag is present)
+    """
+    cli_argv: list[str] = []
+    index = 0
+
+    while index < len(argv):
+        token = argv[index]
+        inline = _action_tokens(token)
+        if inline is not None:
+            return cli_argv, [*inline, *argv[index + 1 :]]
+
+        option = _value_option(token)
+        if option is not None and index + 1 < len(argv):
+            value = argv[index + 1]
+            if VALUE_OPTIONS[option] is None and value.startswith("-"):
+                cli_argv.append(f"{option}={value}")
+            else:
+                cli_argv.extend((token, value))
+            index += 2
+            continue
+
+        cli_argv.append(token)
+        index += 1
+
+    return cli_argv, None
+
+
 def main() -> int:
+    argv = sys.argv[1:]
+    cli_argv, action_argv = split_action_argv(argv)
+
+    # Nothing beyond the version string is needed to answer --version, and
+    # the split above works from VALUE_OPTIONS without building the parser.
+    # It also sets option values apart, so "-p --version" reaches here as
+    # "-p=--version" and is not mistaken for the flag.
+    if "--version" in cli_argv:
+        print(f"mssqlclient-ng {__version__}")
+        return 0
+
     parser = build_parser()
+
+    # Show help if no cli args provided at all (host is required, so argparse
+    # would otherwise reject the empty command line)
+    if not argv:
+        print(banner.display_banner())
+        parser.print_help()
+        return 0
+
     try:
-        args = parser.parse_args()
+        args = parser.parse_args(cli_argv)
+        args.action = action_argv
     except argparse.ArgumentError as exc:
         print(str(exc))
         parser.print_usage()
         return 2
-    except SystemExit:
-        # Raised by argparse for things like --version or malformed invocations
-        return 2
+    except SystemExit as exc:
+        # Raised by argparse for --help (0) or malformed invocations (2)
+        return exc.code if isinstance(exc.code, int) else 2
 
     # Action help: handle before banner/logging to keep output clean
-    if args.action and isinstance(args.action, list) and len(args.action) > 0:
-        action_name = args.action[0]
-        if "--help" in args.action[1:] or "-h" in args.action[1:]:
+    if args.action:
+        action_name, *action_args = args.action
+        if "--help" in action_args or "-h" in action_args:
             if not ActionFactory.action_exists(action_name):
                 print(f"Unknown action: {action_name}")
                 return 1
             ActionFactory.display_action_help(action_name)
             return 0
 
+    # Session dependencies (impacket, prompt_toolkit, services) are imported
+    # only now, so --help, --version and action help never load them.
+    from .core.actions.execution import query
+    from .core.models import server
+    from .core.models.linked_servers import LinkedServers
+    from .core.services.authentication import AuthenticationService
+    from .core.services.database import DatabaseContext
+    from .core.terminal import Terminal
+    from .core.utils import logbook
+    from .core.utils.formatters import OutputFormatter
+
+    # Only pay for the banner once we know a session is actually starting
     print(banner.display_banner())
 
-    # Show help if no cli args provided at all
-    if len(sys.argv) <= 1:
-        parser.print_help()
-        return 0
+    # Validate the target before configuring logging: a malformed host should
+    # not cost a loguru handler setup (or create a log file) just to report it.
+    # loguru's default stderr sink still carries the error.
+    try:
+        server_instance = server.Server.parse_server(server_input=args.host)
+        # Apply -db/--database override if provided
+        if args.database:
+            server_instance.database = args.database
+        # If still no database, leave as None so SQL Server uses the login's default database
+    except ValueError as e:
+        logger.error(f"Invalid host format: {e}")
+        return 1
 
     # Determine log level: --log-level takes precedence, then --trace, then --debug, then INFO
     if args.log_level:
@@ -326,16 +489,6 @@ def main() -> int:
         logger.error(f"Invalid output format: {e}")
         return 1
 
-    try:
-        server_instance = server.Server.parse_server(server_input=args.host)
-        # Apply -db/--database override if provided
-        if args.database:
-            server_instance.database = args.database
-        # If still no database, leave as None so SQL Server uses the login's default database
-    except ValueError as e:
-        logger.error(f"Invalid host format: {e}")
-        return 1
-
     # Establish connection - either via relay or direct authentication
     auth_service = None
     database_context = None
@@ -349,7 +502,7 @@ def main() -> int:
             args.windows_auth,
             args.kerberos,
             args.hashes,
-            getattr(args, "aesKey", None),
+            args.aesKey,
             args.no_pass,
         ]
     ):
@@ -385,9 +538,9 @@ def main() -> int:
 
     else:
         # Extract credentials
-        domain = args.domain if args.domain else ""
-        username = args.username if args.username else ""
-        password = args.password if args.password else ""
+        domain = args.domain or ""
+        username = args.username or ""
+        password = args.password or ""
 
         # Auto-split DOMAIN\user, DOMAIN/user, or user@domain when -d was not provided
         if username and not domain:
@@ -402,7 +555,7 @@ def main() -> int:
             f"Parsed credentials - domain: {domain!r}, username: {username!r}, password set: {bool(password)}, hashes: {args.hashes!r}, windows_auth: {args.windows_auth}, kerberos: {args.kerberos}"
         )
         logger.debug(
-            f"Target - host arg: {args.host!r}, server hostname: {server_instance.hostname!r}, port: {server_instance.port}, dc_ip: {args.dc_ip!r}, target_ip: {getattr(args, 'target_ip', None)!r}"
+            f"Target - host arg: {args.host!r}, server hostname: {server_instance.hostname!r}, port: {server_instance.port}, dc_ip: {args.dc_ip!r}, target_ip: {args.target_ip!r}"
         )
 
         # Show resolved identity before attempting connection
@@ -476,6 +629,17 @@ def main() -> int:
             auth_service.disconnect()
             return 1
 
+    # The refreshed identity is read by actions, the interactive prompt and the
+    # INFO log lines. A one-shot query reads none of it, so when INFO is not
+    # shown either the refresh round-trips below would be pure latency.
+    if args.action:
+        one_shot_query = args.action[0] == "query"
+    else:
+        one_shot_query = bool(args.query)
+    refresh_identity = not one_shot_query or (
+        logger.level(log_level).no <= logger.level("INFO").no
+    )
+
     # Common execution path for both relay and normal authentication
     try:
         # Display pre-impersonation identity (matches MSSQLand GetInfo() order)
@@ -505,7 +669,7 @@ def main() -> int:
 
         # Show impersonation chain if impersonation was applied on the initial server
         impersonation_users = database_context.server.impersonation_users
-        if impersonation_users:
+        if impersonation_users and refresh_identity:
             chain = " → ".join(impersonation_users)
             logger.info(f"Impersonation chain: {chain}")
 
@@ -529,17 +693,15 @@ def main() -> int:
                 )
                 logger.info(f"Server chain: {chain_display}")
 
-                # Compute execution database after linked server chain is set up
-                database_context.query_service.compute_execution_database()
-
                 # Get info from the final server in the chain
-                try:
-                    user_name, system_user = database_context.user_service.get_info()
-                except Exception:
-                    logger.exception("Error retrieving user info from linked server")
-                    return 1
+                if refresh_identity:
+                    try:
+                        user_name, system_user = database_context.user_service.get_info()
+                    except Exception:
+                        logger.exception("Error retrieving user info from linked server")
+                        return 1
 
-                _log_identity(database_context.query_service.execution_server, system_user, user_name)
+                    _log_identity(database_context.query_service.execution_server, system_user, user_name)
 
             except Exception:
                 logger.exception("Failed to set up linked servers")
@@ -557,13 +719,8 @@ def main() -> int:
         if args.query or args.action:
             # Execute single action/query and exit
             if args.action:
-                # args.action is a list: [action_name, arg1, arg2, ]
-                if isinstance(args.action, list) and len(args.action) > 0:
-                    action_name = args.action[0]
-                    argument_list = args.action[1:]
-                else:
-                    logger.error("No action specified")
-                    return 1
+                # args.action is the argv tail: [action_name, arg1, arg2, ]
+                action_name, *argument_list = args.action
 
                 # Handle special case: query action
                 if action_name == "query":
@@ -1,15 +1,21 @@
 # mssqlclient_ng/core/actions/__init__.py
 
 # Local library imports
-from . import agent, execution, administration, remote, database, filesystem, domain, configmgr
-
-__all__ = [
-    "agent",
-    "execution",
-    "administration",
-    "remote",
-    "database",
-    "filesystem",
-    "domain",
-    "configmgr",
-]
+from ..utils.lazy import make_getattr
+
+_EXPORTS = dict.fromkeys(
+    [
+        "agent",
+        "execution",
+        "administration",
+        "remote",
+        "database",
+        "filesystem",
+        "domain",
+        "configmgr",
+    ]
+)
+
+__all__ = list(_EXPORTS)
+
+__getattr__ = make_getattr(__name__, _EXPORTS)
@@ -2,19 +2,18 @@
 Administration actions for SQL Server management.
 """
 
-# Import actions to trigger registration with ActionFactory
-from ..administration.audit import Audit
-from ..administration.config import Config
-from ..administration.sessions import Sessions
-from ..administration.createuser import CreateUser
-from ..administration.kill import Kill
-from ..administration.requests import Requests
+# Local library imports
+from ...utils.lazy import make_getattr
 
-__all__ = [
-    "Audit",
-    "Config",
-    "Sessions",
-    "CreateUser",
-    "Kill",
-    "Requests",
-]
+_EXPORTS = {
+    "Audit": "audit",
+    "Config": "config",
+    "Sessions": "sessions",
+    "CreateUser": "createuser",
+    "Kill": "kill",
+    "Requests": "requests",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__ = make_getattr(__name__, _EXPORTS)
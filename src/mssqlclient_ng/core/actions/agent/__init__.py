@@ -2,16 +2,17 @@
 Agent actions for SQL Server Agent job management.
 """
 
-from .jobs import Jobs
-from .job import Job
-from .job_exec import JobExec
-from .job_history import JobHistory
-from .job_proxies import JobProxies
+# Local library imports
+from ...utils.lazy import make_getattr
 
-__all__ = [
-    "Jobs",
-    "Job",
-    "JobExec",
-    "JobHistory",
-    "JobProxies",
-]
+_EXPORTS = {
+    "Jobs": "jobs",
+    "Job": "job",
+    "JobExec": "job_exec",
+    "JobHistory": "job_history",
+    "JobProxies": "job_proxies",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__ = make_getattr(__name__, _EXPORTS)
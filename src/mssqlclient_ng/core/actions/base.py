@@ -92,6 +92,9 @@ class BaseAction(ABC):
     # Auto-computed from Arg(remainder=True) fields, or set manually.
     _remainder_after: int | None = None
 
+    # Per-class Arg() descriptor map, filled on first _get_arg_fields() call
+    _arg_fields_cache: dict[str, "Arg"]
+
     def validate_arguments(self, additional_arguments: str = "") -> None:
         """
         Validate and bind action arguments.
@@ -115,12 +118,22 @@ class BaseAction(ABC):
 
     @classmethod
     def _get_arg_fields(cls) -> dict[str, "Arg"]:
-        """Get all Arg() descriptors from the class hierarchy."""
+        """
+        Get all Arg() descriptors from the class hierarchy.
+
+        The MRO walk runs once per class; descriptors are fixed at class
+        creation, so the result is cached on the class itself (read-only).
+        """
+        cached = cls.__dict__.get("_arg_fields_cache")
+        if cached is not None:
+            return cached
+
         fields = {}
         for klass in reversed(cls.__mro__):
             for name, value in vars(klass).items():
                 if isinstance(value, Arg):
                     fields[name] = value
+        cls._arg_fields_cache = fields
         return fields
 
     @classmethod
@@ -226,11 +239,20 @@ class BaseAction(ABC):
             logger.debug("No arguments provided.")
             return []
 
+        # Fast path: without quotes or escapes shlex reduces to a whitespace split
+        if not any(char in additional_arguments for char in "\"'\\"):
+            splitted = [arg for arg in additional_arguments.split() if arg != separator]
+            logger.debug(f"Splitted arguments: {splitted}")
+            return splitted
+
         # Use shlex to split respecting quotes
         # Use posix=True (default) to properly strip quotes from arguments
+        # Quoted tokens may carry padding, so strip them here once
         try:
             splitted = [
-                arg for arg in shlex.split(additional_arguments) if arg != separator
+                arg.strip()
+                for arg in shlex.split(additional_arguments)
+                if arg != separator
             ]
             logger.debug(f"Splitted arguments: {splitted}")
             return splitted
@@ -243,6 +265,13 @@ class BaseAction(ABC):
                 if arg.strip() and arg != separator
             ]
 
+    @staticmethod
+    def _is_flag_token(token: str) -> bool:
+        """Return True if token is a --long flag or a -x short flag."""
+        if len(token) < 2 or token[0] != "-":
+            return False
+        return token[1] == "-" or (len(token) == 2 and token[1].isalpha())
+
     def _parse_action_arguments(
         self,
         additional_arguments: str = "",
@@ -273,7 +302,7 @@ class BaseAction(ABC):
             parts = self.split_arguments(additional_arguments)
         i = 0
         while i < len(parts):
-            part = parts[i].strip()
+            part = parts[i]
 
             # Once we've collected enough positional args, treat the rest as positional
             if (
@@ -281,68 +310,37 @@ class BaseAction(ABC):
                 and len(positional) >= self._remainder_after
             ):
                 positional.append(part)
-                logger.debug(f"Parsed remainder argument: {part}")
                 i += 1
                 continue
 
-            # Check for --long-flag=value format
-            if part.startswith("--") and "=" in part:
-                flag_part = part[2:]  # Remove --
-                flag_name, flag_value = flag_part.split("=", 1)
-                named[flag_name] = flag_value
-                logger.debug(f"Parsed named argument: {flag_name} = {flag_value}")
-                i += 1
-                continue
-
-            # Check for --long-flag format (value in next part)
-            if part.startswith("--"):
-                flag_name = part[2:]
-                if (
-                    i + 1 < len(parts)
-                    and not parts[i + 1].startswith("--")
-                    and not (
-                        parts[i + 1].startswith("-")
-                        and len(parts[i + 1]) == 2
-                        and parts[i + 1][1].isalpha()
-                    )
-                ):
-                    flag_value = parts[i + 1]
-                    named[flag_name] = flag_value
-                    logger.debug(f"Parsed named argument: {flag_name} = {flag_value}")
-                    i += 2
-                else:
-                    named[flag_name] = ""
-                    logger.debug(f"Parsed named argument (no value): {flag_name}")
-                    i += 1
-                continue
-
-            # Check for -f format (short flag, value in next part)
-            if part.startswith("-") and len(part) == 2 and part[1].isalpha():
-                flag_name = part[1]
-                if (
-                    i + 1 < len(parts)
-                    and not parts[i + 1].startswith("--")
-                    and not (
-                        parts[i + 1].startswith("-")
-                        and len(parts[i + 1]) == 2
-                        and parts[i + 1][1].isalpha()
-                    )
-                ):
-                    flag_value = parts[i + 1]
-                    named[flag_name] = flag_value
-                    logger.debug(f"Parsed named argument: {flag_name} = {flag_value}")
+            # Classify the token once: --long[=value], -x, or positional
+            flag_name = None
+            if len(part) >= 2 and part[0] == "-":
+                if part[1] == "-":
+                    flag_name, eq, flag_value = part[2:].partition("=")
+                    if eq:
+                        # --long-flag=value format
+                        named[flag_name] = flag_value
+                        i += 1
+                        continue
+                elif len(part) == 2 and part[1].isalpha():
+                    flag_name = part[1]
+
+            if flag_name is not None:
+                # --long-flag or -f format (value in next part)
+                if i + 1 < len(parts) and not self._is_flag_token(parts[i + 1]):
+                    named[flag_name] = parts[i + 1]
                     i += 2
                 else:
                     named[flag_name] = ""
-                    logger.debug(f"Parsed named argument (no value): {flag_name}")
                     i += 1
                 continue
 
             # Otherwise it's a positional argument
             positional.append(part)
-            logger.debug(f"Parsed positional argument: {part}")
             i += 1
 
+        logger.debug(f"Parsed arguments: named={named}, positional={positional}")
         return named, positional
 
     def get_named_argument(
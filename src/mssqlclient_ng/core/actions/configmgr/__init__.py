@@ -2,62 +2,40 @@
 
 """ConfigMgr (SCCM) actions for database-level reconnaissance and exploitation."""
 
-from .cm_info import CMInfo
-from .cm_servers import CMServers
-from .cm_collections import CMCollections
-from .cm_collection import CMCollection
-from .cm_devices import CMDevices
-from .cm_device import CMDevice
-from .cm_health import CMHealth
-from .cm_deployments import CMDeployments
-from .cm_deployment import CMDeployment
-from .cm_deployment_types import CMDeploymentTypes
-from .cm_deployment_type import CMDeploymentType
-from .cm_applications import CMApplications
-from .cm_packages import CMPackages
-from .cm_package import CMPackage
-from .cm_programs import CMPrograms
-from .cm_distribution_points import CMDistributionPoints
-from .cm_task_sequences import CMTaskSequences
-from .cm_task_sequence import CMTaskSequence
-from .cm_accounts import CMAccounts
-from .cm_aad_apps import CMAadApps
-from .cm_scripts import CMScripts
-from .cm_script import CMScript
-from .cm_script_add import CMScriptAdd
-from .cm_script_delete import CMScriptDelete
-from .cm_script_run import CMScriptRun
-from .cm_script_status import CMScriptStatus
-from .cm_rbac_add import CMRbacAdd
-from .cm_log_trace import CMLogTrace
+# Local library imports
+from ...utils.lazy import make_getattr
 
-__all__ = [
-    "CMInfo",
-    "CMServers",
-    "CMCollections",
-    "CMCollection",
-    "CMDevices",
-    "CMDevice",
-    "CMHealth",
-    "CMDeployments",
-    "CMDeployment",
-    "CMDeploymentTypes",
-    "CMDeploymentType",
-    "CMApplications",
-    "CMPackages",
-    "CMPackage",
-    "CMPrograms",
-    "CMDistributionPoints",
-    "CMTaskSequences",
-    "CMTaskSequence",
-    "CMAccounts",
-    "CMAadApps",
-    "CMScripts",
-    "CMScript",
-    "CMScriptAdd",
-    "CMScriptDelete",
-    "CMScriptRun",
-    "CMScriptStatus",
-    "CMRbacAdd",
-    "CMLogTrace",
-]
+_EXPORTS = {
+    "CMInfo": "cm_info",
+    "CMServers": "cm_servers",
+    "CMCollections": "cm_collections",
+    "CMCollection": "cm_collection",
+    "CMDevices": "cm_devices",
+    "CMDevice": "cm_device",
+    "CMHealth": "cm_health",
+    "CMDeployments": "cm_deployments",
+    "CMDeployment": "cm_deployment",
+    "CMDeploymentTypes": "cm_deployment_types",
+    "CMDeploymentType": "cm_deployment_type",
+    "CMApplications": "cm_applications",
+    "CMPackages": "cm_packages",
+    "CMPackage": "cm_package",
+    "CMPrograms": "cm_programs",
+    "CMDistributionPoints": "cm_distribution_points",
+    "CMTaskSequences": "cm_task_sequences",
+    "CMTaskSequence": "cm_task_sequence",
+    "CMAccounts": "cm_accounts",
+    "CMAadApps": "cm_aad_apps",
+    "CMScripts": "cm_scripts",
+    "CMScript": "cm_script",
+    "CMScriptAdd": "cm_script_add",
+    "CMScriptDelete": "cm_script_delete",
+    "CMScriptRun": "cm_script_run",
+    "CMScriptStatus": "cm_script_status",
+    "CMRbacAdd": "cm_rbac_add",
+    "CMLogTrace": "cm_log_trace",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__ = make_getattr(__name__, _EXPORTS)
@@ -2,41 +2,29 @@
 Database actions for SQL Server database management.
 """
 
-# Import actions to trigger registration with ActionFactory
-from ..database.authtoken import AuthToken
-from ..database.databases import Databases
-from ..database.xprocs import ExtendedProcs
-from ..database.hashes import Hashes
-from ..database.impersonate import Impersonation
-from ..database.impersonation_map import ImpersonationMap
-from ..database.info import Info
-from ..database.oledb_providers import OleDbProviders
-from ..database.permissions import Permissions
-from ..database.procedures import Procedures
-from ..database.rolemembers import RoleMembers
-from ..database.roles import Roles
-from ..database.rows import Rows
-from ..database.search import Search
-from ..database.tables import Tables
-from ..database.users import Users
-from ..database.whoami import Whoami
+# Local library imports
+from ...utils.lazy import make_getattr
 
-__all__ = [
-    "AuthToken",
-    "Databases",
-    "ExtendedProcs",
-    "Hashes",
-    "Impersonation",
-    "ImpersonationMap",
-    "Info",
-    "OleDbProviders",
-    "Permissions",
-    "Procedures",
-    "RoleMembers",
-    "Roles",
-    "Rows",
-    "Search",
-    "Tables",
-    "Users",
-    "Whoami",
-]
+_EXPORTS = {
+    "AuthToken": "authtoken",
+    "Databases": "databases",
+    "ExtendedProcs": "xprocs",
+    "Hashes": "hashes",
+    "Impersonation": "impersonate",
+    "ImpersonationMap": "impersonation_map",
+    "Info": "info",
+    "OleDbProviders": "oledb_providers",
+    "Permissions": "permissions",
+    "Procedures": "procedures",
+    "RoleMembers": "rolemembers",
+    "Roles": "roles",
+    "Rows": "rows",
+    "Search": "search",
+    "Tables": "tables",
+    "Users": "users",
+    "Whoami": "whoami",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__ = make_getattr(__name__, _EXPORTS)
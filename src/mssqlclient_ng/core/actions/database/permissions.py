@@ -9,8 +9,24 @@ from loguru import logger
 from ..base import Arg, BaseAction
 from ..factory import ActionFactory
 from ...services.database import DatabaseContext
+from ...utils import common
 from ...utils.formatters import OutputFormatter
 
+# Server permissions, database permissions and database access in one
+# round-trip; the Scope column tells the three result sets apart.
+# master's catalog collation may differ from the current database's.
+_OVERVIEW_QUERY = (
+    "SELECT 'SERVER' AS Scope, permission_name COLLATE DATABASE_DEFAULT AS Value FROM fn_my_permissions(NULL, 'SERVER') "
+    "UNION ALL SELECT 'DATABASE', permission_name COLLATE DATABASE_DEFAULT FROM fn_my_permissions(NULL, 'DATABASE') "
+    "UNION ALL SELECT 'ACCESS', name COLLATE DATABASE_DEFAULT FROM master.sys.databases WHERE HAS_DBACCESS(name) = 1;"
+)
+
+# The object name is bound as a parameter (see QueryService.parameterize)
+_OBJECT_QUERY = (
+    "SELECT DISTINCT permission_name AS [Permission] "
+    "FROM fn_my_permissions(@object, 'OBJECT');"
+)
+
 @ActionFactory.register(
     "permissions",
     "Enumerate current user's permissions via fn_my_permissions. No argument shows server-level and database-level permissions plus accessible databases. Pass schema.table or database.schema.table to check object-level permissions.",
@@ -36,6 +52,7 @@ class Permissions(BaseAction):
         self._database = None
         self._schema = None
         self._table: str = ""
+        self._target_table: str = ""
 
     def validate_arguments(self, additional_arguments: str = "") -> None:
         """
@@ -82,6 +99,13 @@ class Permissions(BaseAction):
                 "'schema.table', or nothing to return current server permissions."
             )
 
+        # Quote the object name once; execute() only interpolates it
+        if self._schema:
+            self._target_table = f"[{self._schema}].[{self._table}]"
+        else:
+            # No schema specified - let SQL Server use the user's default schema
+            self._target_table = f"..[{self._table}]"
+
     def execute(self, database_context: DatabaseContext) -> list | None:
         """
         Execute the permissions enumeration.
@@ -96,30 +120,30 @@ class Permissions(BaseAction):
             logger.info(
                 "Listing permissions of the current user on server and accessible databases"
             )
+            rows = database_context.query_service.execute_table(_OVERVIEW_QUERY)
+            sections: dict[str, list[str]] = {"SERVER": [], "DATABASE": [], "ACCESS": []}
+            for row in rows:
+                sections.setdefault(row.get("Scope"), []).append(row.get("Value"))
+
             print()
             logger.info("Server permissions")
-
-            server_perms = database_context.query_service.execute_table(
-                "SELECT permission_name AS Permission FROM fn_my_permissions(NULL, 'SERVER');"
+            sorted_server_perms = self._sort_permissions_by_importance(
+                [{"Permission": name} for name in sections["SERVER"]]
             )
-            sorted_server_perms = self._sort_permissions_by_importance(server_perms)
             print(OutputFormatter.convert_list_of_dicts(sorted_server_perms))
             print()
 
             logger.info("Database permissions")
-
-            db_perms = database_context.query_service.execute_table(
-                "SELECT permission_name AS Permission FROM fn_my_permissions(NULL, 'DATABASE');"
+            sorted_db_perms = self._sort_permissions_by_importance(
+                [{"Permission": name} for name in sections["DATABASE"]]
             )
-            sorted_db_perms = self._sort_permissions_by_importance(db_perms)
             print(OutputFormatter.convert_list_of_dicts(sorted_db_perms))
             print()
 
             logger.info("Database access")
-
-            accessible_dbs = database_context.query_service.execute_table(
-                "SELECT name AS [Accessible Database] FROM master.sys.databases WHERE HAS_DBACCESS(name) = 1;"
-            )
+            accessible_dbs = [
+                {"Accessible Database": name} for name in sections["ACCESS"]
+            ]
             print(OutputFormatter.convert_list_of_dicts(accessible_dbs))
 
             return [sorted_server_perms, sorted_db_perms, accessible_dbs]
@@ -128,17 +152,10 @@ class Permissions(BaseAction):
         if not self._database:
             self._database = database_context.query_service.execution_database
 
-        # Build the target table name based on what was specified
-        if self._schema:
-            target_table = f"[{self._schema}].[{self._table}]"
-        else:
-            # No schema specified - let SQL Server use the user's default schema
-            target_table = f"..[{self._table}]"
-
         mapped_user = database_context.user_service.mapped_user
 
         logger.info(
-            f"Listing permissions for {mapped_user} on [{self._database}]{target_table}"
+            f"Listing permissions for {mapped_user} on [{self._database}]{self._target_table}"
         )
 
         # Build USE statement if specific database is different from current
@@ -146,17 +163,12 @@ class Permissions(BaseAction):
             ""
             if not self._database
             or self._database == database_context.query_service.execution_database
-            else f"USE [{self._database}];"
+            else f"USE {common.quote_identifier(self._database)};"
         )
 
-        # Query to get permissions
-        query = f"""
-            {use_statement}
-            SELECT DISTINCT
-                permission_name AS [Permission]
-            FROM
-                fn_my_permissions('{target_table}', 'OBJECT');
-            """
+        query = use_statement + database_context.query_service.parameterize(
+            _OBJECT_QUERY, object=self._target_table
+        )
 
         data_table = database_context.query_service.execute_table(query)
         sorted_table = self._sort_permissions_by_importance(data_table)
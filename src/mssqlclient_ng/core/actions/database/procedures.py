@@ -10,8 +10,48 @@ from loguru import logger
 from ..base import Arg, BaseAction
 from ..factory import ActionFactory
 from ...services.database import DatabaseContext
+from ...utils import common
 from ...utils.formatters import OutputFormatter
 
+# Invariant statements; user-supplied names only ever travel as parameters
+_LIST_QUERY = """
+SELECT
+    SCHEMA_NAME(p.schema_id) AS [Schema],
+    p.name AS [Name],
+    USER_NAME(OBJECTPROPERTY(p.object_id, 'OwnerId')) AS [Owner],
+    CASE
+        WHEN m.execute_as_principal_id IS NULL THEN ''
+        WHEN m.execute_as_principal_id = -2 THEN 'OWNER'
+        ELSE USER_NAME(m.execute_as_principal_id)
+    END AS [ExecuteAsContext],
+    p.create_date AS [Created],
+    p.modify_date AS [Modified]
+FROM sys.procedures p
+INNER JOIN sys.sql_modules m ON p.object_id = m.object_id;
+"""
+
+_PERMISSIONS_QUERY = """
+SELECT
+    SCHEMA_NAME(o.schema_id) AS schema_name,
+    o.name AS object_name,
+    p.permission_name
+FROM sys.objects o
+CROSS APPLY fn_my_permissions(QUOTENAME(SCHEMA_NAME(o.schema_id)) + '.' + QUOTENAME(o.name), 'OBJECT') p
+WHERE o.type = 'P'
+ORDER BY o.name, p.permission_name;
+"""
+
+_DEFINITION_QUERY = """
+SELECT
+    m.definition
+FROM sys.sql_modules AS m
+INNER JOIN sys.objects AS o ON m.object_id = o.object_id
+INNER JOIN sys.schemas AS s ON o.schema_id = s.schema_id
+WHERE o.type = 'P'
+AND o.name = @procedure
+AND s.name = @schema;
+"""
+
 class ProcedureMode(Enum):
     """Execution mode for the procedures action."""
 
@@ -49,6 +89,7 @@ class Procedures(BaseAction):
         self._procedure_args: str | None = None
         self._search_keyword: str | None = None
         self._procedure_file_path: str | None = None
+        self._sql_content: str = ""
         self._target_database: str | None = None
 
     def _validate_procedure_format(self, procedure_name: str) -> None:
@@ -76,14 +117,13 @@ class Procedures(BaseAction):
         Raises:
             ValueError: If arguments are invalid.
         """
-        if not additional_arguments or not additional_arguments.strip():
+        arguments = additional_arguments.strip() if additional_arguments else ""
+        if not arguments:
             # Default to listing stored procedures
             return
 
         # Parse arguments using the base class method
-        named_args, positional_args = self._parse_action_arguments(
-            additional_arguments.strip()
-        )
+        named_args, positional_args = self._parse_action_arguments(arguments)
 
         # Extract mode from position 0
         mode_str = positional_args[0] if positional_args else None
@@ -128,6 +168,17 @@ class Procedures(BaseAction):
             self._procedure_file_path = self._procedure_name
             self._target_database = self._procedure_args
 
+            # Read the file now: a bad path fails validation before any SQL is
+            # sent, and execute() only has to ship the batch
+            try:
+                with open(self._procedure_file_path, encoding="utf-8") as f:
+                    self._sql_content = f.read()
+            except OSError as e:
+                raise ValueError(f"Cannot read SQL file: {e}") from e
+
+            if not self._sql_content.strip():
+                raise ValueError("SQL file is empty")
+
     def execute(self, database_context: DatabaseContext) -> list[dict] | None:
         """
         Executes the procedures action based on the selected mode.
@@ -168,17 +219,19 @@ class Procedures(BaseAction):
         )
 
         try:
-            with open(self._procedure_file_path, encoding="utf-8") as f:
-                sql_content = f.read()
-
-            if not sql_content.strip():
-                raise ValueError("SQL file is empty")
-
             if self._target_database:
-                use_db_statement = f"USE [{self._target_database}];\n"
-                sql_content = use_db_statement + sql_content
-
-            database_context.query_service.execute(sql_content)
+                # CREATE PROCEDURE must open its batch, so it cannot follow a
+                # USE; the database's own sp_executesql runs it in that context
+                # in the same round-trip, linked servers included. Escaping
+                # and wrapping still copy the body twice; only the raw
+                # content path below sends it without a copy.
+                escaped_sql = self._sql_content.replace("'", "''")
+                database_context.query_service.execute(
+                    f"EXEC {common.quote_identifier(self._target_database)}"
+                    f".sys.sp_executesql N'{escaped_sql}';"
+                )
+            else:
+                database_context.query_service.execute(self._sql_content)
 
             logger.success(
                 f"Stored procedure created successfully from {self._procedure_file_path} in {target_db}"
@@ -203,43 +256,17 @@ class Procedures(BaseAction):
         exec_db = database_context.query_service.execution_database
         logger.info(f"Retrieving all stored procedures in [{exec_db}]")
 
-        query = """
-            SELECT
-                SCHEMA_NAME(p.schema_id) AS [Schema],
-                p.name AS [Name],
-                USER_NAME(OBJECTPROPERTY(p.object_id, 'OwnerId')) AS [Owner],
-                CASE
-                    WHEN m.execute_as_principal_id IS NULL THEN ''
-                    WHEN m.execute_as_principal_id = -2 THEN 'OWNER'
-                    ELSE USER_NAME(m.execute_as_principal_id)
-                END AS [ExecuteAsContext],
-                p.create_date AS [Created],
-                p.modify_date AS [Modified]
-            FROM sys.procedures p
-            INNER JOIN sys.sql_modules m ON p.object_id = m.object_id;
-        """
-
         try:
-            procedures = database_context.query_service.execute_table(query)
+            procedures = database_context.query_service.execute_table(_LIST_QUERY)
 
             if not procedures:
                 logger.warning("No stored procedures found")
                 return []
 
             # Get all permissions in a single query
-            permissions_query = """
-                SELECT
-                    SCHEMA_NAME(o.schema_id) AS schema_name,
-                    o.name AS object_name,
-                    p.permission_name
-                FROM sys.objects o
-                CROSS APPLY fn_my_permissions(QUOTENAME(SCHEMA_NAME(o.schema_id)) + '.' + QUOTENAME(o.name), 'OBJECT') p
-                WHERE o.type = 'P'
-                ORDER BY o.name, p.permission_name;
-            """
 
             all_permissions = database_context.query_service.execute_table(
-                permissions_query
+                _PERMISSIONS_QUERY
             )
 
             # Build a dictionary for fast lookup: key = "schema.procedure", value = list of permissions
@@ -360,19 +387,11 @@ class Procedures(BaseAction):
 
         # Parse schema.procedure format
         parts = self._procedure_name.split(".")
-        schema = parts[0].replace("'", "''")
-        procedure = parts[1].replace("'", "''")
-
-        query = f"""
-            SELECT
-                m.definition
-            FROM sys.sql_modules AS m
-            INNER JOIN sys.objects AS o ON m.object_id = o.object_id
-            INNER JOIN sys.schemas AS s ON o.schema_id = s.schema_id
-            WHERE o.type = 'P'
-            AND o.name = '{procedure}'
-            AND s.name = '{schema}';
-        """
+        query = database_context.query_service.parameterize(
+            _DEFINITION_QUERY,
+            schema=parts[0],
+            procedure=parts[1],
+        )
 
         try:
             result = database_context.query_service.execute_table(query)
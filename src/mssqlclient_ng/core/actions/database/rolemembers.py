@@ -9,6 +9,21 @@ from ..factory import ActionFactory
 from ...services.database import DatabaseContext
 from ...utils.formatters import OutputFormatter
 
+# Role name is bound as a parameter (see QueryService.parameterize)
+_MEMBERS_QUERY = """
+SELECT
+    l.name AS LoginName,
+    l.type_desc AS LoginType,
+    l.is_disabled AS IsDisabled,
+    l.create_date AS CreateDate,
+    l.modify_date AS ModifyDate
+FROM master.sys.server_role_members rm
+JOIN master.sys.server_principals r ON rm.role_principal_id = r.principal_id
+JOIN master.sys.server_principals l ON rm.member_principal_id = l.principal_id
+WHERE r.name = @role
+ORDER BY l.create_date DESC;
+"""
+
 @ActionFactory.register("rolemembers", "List members of a specific server role (e.g., sysadmin).")
 class RoleMembers(BaseAction):
     """
@@ -32,22 +47,9 @@ class RoleMembers(BaseAction):
         """
         logger.info(f"Retrieving members of server role: {self._role_name}")
 
-        # Escape single quotes in role name for SQL injection prevention
-        escaped_role_name = self._role_name.replace("'", "''")
-
-        query = f"""
-            SELECT
-                l.name AS LoginName,
-                l.type_desc AS LoginType,
-                l.is_disabled AS IsDisabled,
-                l.create_date AS CreateDate,
-                l.modify_date AS ModifyDate
-            FROM master.sys.server_role_members rm
-            JOIN master.sys.server_principals r ON rm.role_principal_id = r.principal_id
-            JOIN master.sys.server_principals l ON rm.member_principal_id = l.principal_id
-            WHERE r.name = '{escaped_role_name}'
-            ORDER BY l.create_date DESC;
-        """
+        query = database_context.query_service.parameterize(
+            _MEMBERS_QUERY, role=self._role_name
+        )
 
         result = database_context.query_service.execute_table(query)
 
@@ -9,6 +9,7 @@ from loguru import logger
 from ..base import Arg, BaseAction
 from ..factory import ActionFactory
 from ...services.database import DatabaseContext
+from ...utils import common
 from ...utils.formatters import OutputFormatter
 
 @ActionFactory.register(
@@ -97,7 +98,9 @@ class Tables(BaseAction):
         filter_msg = f" ({', '.join(parts)})" if parts else ""
         logger.info(f"Retrieving tables from [{target_database}]{filter_msg}")
 
-        use_statement = f"USE [{self._database}];" if self._database else ""
+        use_statement = (
+            f"USE {common.quote_identifier(self._database)};" if self._database else ""
+        )
 
         # Build WHERE clause
         where_parts = ["t.type IN ('U', 'V')"]
@@ -147,22 +150,21 @@ class Tables(BaseAction):
             logger.warning("No tables found.")
             return tables
 
-        # Collect object IDs for batch queries
-        object_ids = [str(t["ObjectId"]) for t in tables]
-        object_id_filter = ",".join(object_ids)
-
+        # Follow-up queries reuse the same filter rather than an IN list of every
+        # object_id: the statement stays small (OPENQUERY caps it at 8 KB) no
+        # matter how wide the schema is.
         # Optionally get columns
         if self._show_columns:
             columns_query = f"""
                 {use_statement}
                 SELECT
-                    o.object_id,
+                    t.object_id,
                     c.name AS column_name,
                     TYPE_NAME(c.user_type_id) AS data_type
                 FROM sys.columns c
-                INNER JOIN sys.objects o ON c.object_id = o.object_id
-                WHERE o.object_id IN ({object_id_filter})
-                ORDER BY o.object_id, c.column_id;
+                INNER JOIN sys.objects t ON c.object_id = t.object_id
+                WHERE {where_clause}
+                ORDER BY t.object_id, c.column_id;
             """
             columns_result = database_context.query_service.execute_table(columns_query)
             columns_dict: dict[str, list[str]] = {}
@@ -176,13 +178,13 @@ class Tables(BaseAction):
             perms_query = f"""
                 {use_statement}
                 SELECT
-                    o.object_id,
+                    t.object_id,
                     p.permission_name
-                FROM sys.objects o
+                FROM sys.objects t
                 CROSS APPLY fn_my_permissions(
-                    QUOTENAME(SCHEMA_NAME(o.schema_id)) + '.' + QUOTENAME(o.name), 'OBJECT'
+                    QUOTENAME(SCHEMA_NAME(t.schema_id)) + '.' + QUOTENAME(t.name), 'OBJECT'
                 ) p
-                WHERE o.object_id IN ({object_id_filter});
+                WHERE {where_clause};
             """
             perms_result = database_context.query_service.execute_table(perms_query)
             perms_dict: dict[str, set] = {}
@@ -1,21 +1,19 @@
 # mssqlclient_ng/core/actions/domain/__init__.py
 
-from .ridcycle import RidCycle
-from .addomain import DomainSid
-from .adsid import AdSid
-from .adsi_add import AdsiAdd
-from .adsi_del import AdsiDel
-from .adsi_query import AdsiQuery
-from .adsi_creds import AdsiCredentialExtractor
-from .adsi_redirect import AdsiRedirect
+# Local library imports
+from ...utils.lazy import make_getattr
 
-__all__ = [
-    "RidCycle",
-    "DomainSid",
-    "AdSid",
-    "AdsiAdd",
-    "AdsiDel",
-    "AdsiQuery",
-    "AdsiCredentialExtractor",
-    "AdsiRedirect",
-]
+_EXPORTS = {
+    "RidCycle": "ridcycle",
+    "DomainSid": "addomain",
+    "AdSid": "adsid",
+    "AdsiAdd": "adsi_add",
+    "AdsiDel": "adsi_del",
+    "AdsiQuery": "adsi_query",
+    "AdsiCredentialExtractor": "adsi_creds",
+    "AdsiRedirect": "adsi_redirect",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__ = make_getattr(__name__, _EXPORTS)
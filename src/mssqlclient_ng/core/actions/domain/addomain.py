@@ -36,29 +36,24 @@ class DomainSid(BaseAction):
         logger.info("Retrieving domain SID")
 
         try:
-            # 1) Get the default domain
-            domain_result = database_context.query_service.execute_table(
-                "SELECT DEFAULT_DOMAIN();"
+            # Resolve the domain and the SID of its Domain Admins group in one
+            # round-trip; the group name is built server-side from DEFAULT_DOMAIN()
+            result_table = database_context.query_service.execute_table(
+                "SELECT DEFAULT_DOMAIN() AS Domain, "
+                "SUSER_SID(DEFAULT_DOMAIN() + N'\\Domain Admins') AS Sid;"
             )
+            row = result_table[0] if result_table else {}
 
-            if not domain_result or not domain_result[0][next(iter(domain_result[0]))]:
+            domain = row.get("Domain")
+            if not domain:
                 logger.error(
                     "Could not determine DEFAULT_DOMAIN(). The server may not be domain-joined."
                 )
                 return None
 
-            domain = next(iter(domain_result[0].values()))
             logger.info(f"Domain: {domain}")
 
-            # 2) Obtain the domain SID by querying a known group (Domain Admins)
-            sid_result_table = database_context.query_service.execute_table(
-                f"SELECT SUSER_SID('{domain}\\Domain Admins');"
-            )
-
-            if (
-                not sid_result_table
-                or not sid_result_table[0][next(iter(sid_result_table[0]))]
-            ):
+            if not row.get("Sid"):
                 logger.error(
                     "Could not obtain domain SID via SUSER_SID(). "
                     "Ensure the server has access to the domain."
@@ -66,7 +61,7 @@ class DomainSid(BaseAction):
                 return None
 
             # Extract the binary SID from the query result
-            raw_sid_obj = next(iter(sid_result_table[0].values()))
+            raw_sid_obj = row["Sid"]
 
             # Parse the binary SID
             ad_domain_string = sid_bytes_to_string(raw_sid_obj)
@@ -76,13 +71,11 @@ class DomainSid(BaseAction):
                 return None
 
             # Strip the trailing RID to get the domain SID prefix
-            last_dash = ad_domain_string.rfind("-")
-            if last_dash <= 0:
+            ad_domain_prefix, _, _ = ad_domain_string.rpartition("-")
+            if not ad_domain_prefix:
                 logger.error(f"Unexpected SID format: {ad_domain_string}")
                 return None
 
-            ad_domain_prefix = ad_domain_string[:last_dash]
-
             print()
             logger.success("Domain SID information retrieved")
 
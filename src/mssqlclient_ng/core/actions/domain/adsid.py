@@ -47,8 +47,7 @@ class AdSid(BaseAction):
                 logger.error("Could not obtain user SID via SUSER_SID().")
                 return None
 
-            # Extract the SID from the query result (first column value)
-            raw_sid_obj = next(iter(dt_sid[0].values())) if dt_sid[0] else None
+            raw_sid_obj = dt_sid[0].get("SID")
 
             if raw_sid_obj is None:
                 logger.error("SUSER_SID() returned NULL.")
@@ -62,7 +61,7 @@ class AdSid(BaseAction):
                 try:
                     # Remove '0x' prefix and convert to hex bytes for sid_bytes_to_string
                     hex_str = raw_sid_obj
-                    if hex_str.startswith("0x") or hex_str.startswith("0X"):
+                    if hex_str.startswith(("0x", "0X")):
                         hex_str = hex_str[2:]
 
                     # Convert to ASCII bytes format that sid_bytes_to_string expects
@@ -110,11 +109,9 @@ class AdSid(BaseAction):
             # Domain SIDs have format: S-1-5-21-<domain>-<rid>
             # The domain portion consists of three sub-authorities before the RID
             if ad_sid_string.startswith("S-1-5-21-"):
-                parts = ad_sid_string.split("-")
-                if len(parts) >= 8:  # S-1-5-21-X-Y-Z-RID
-                    # Domain SID is everything except the last component (RID)
-                    ad_domain = "-".join(parts[:-1])
-                    rid = parts[-1]
+                # Domain SID is everything except the last component (RID)
+                ad_domain, _, rid = ad_sid_string.rpartition("-")
+                if ad_domain.count("-") >= 6:  # S-1-5-21-X-Y-Z-RID
                     result["Domain SID"] = ad_domain
 
                     # Compute domain hex SID and hex RID from the full hex SID
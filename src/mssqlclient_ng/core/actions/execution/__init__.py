@@ -1,21 +1,19 @@
 # mssqlclient_ng/core/actions/execution/__init__.py
 
-from .query import Query
-from .xpcmd import XpCmd
-from .powershell import PowerShell
-from .ole import ObjectLinkingEmbedding
-from .clr import ClrExecution
-from .clr_list import ClrList
-from .clr_inspect import ClrInspect
-from .run import RunExecutable
+# Local library imports
+from ...utils.lazy import make_getattr
 
-__all__ = [
-    "Query",
-    "XpCmd",
-    "PowerShell",
-    "ObjectLinkingEmbedding",
-    "ClrExecution",
-    "ClrList",
-    "ClrInspect",
-    "RunExecutable",
-]
+_EXPORTS = {
+    "Query": "query",
+    "XpCmd": "xpcmd",
+    "PowerShell": "powershell",
+    "ObjectLinkingEmbedding": "ole",
+    "ClrExecution": "clr",
+    "ClrList": "clr_list",
+    "ClrInspect": "clr_inspect",
+    "RunExecutable": "run",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__ = make_getattr(__name__, _EXPORTS)
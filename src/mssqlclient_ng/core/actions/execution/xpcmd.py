@@ -52,14 +52,13 @@ class XpCmd(BaseAction):
             rows: list[Any] = database_context.query_service.execute(query, tuple_mode=True)  # type: ignore[assignment]
 
             if rows:
+                output_lines = [
+                    str(row[0]).rstrip() for row in rows if row[0] is not None
+                ]
                 print()
-                for row in rows:
-                    cell = row[0]
-                    if cell is None:
-                        continue
-                    line = str(cell).rstrip()
-                    print(line)
-                    output_lines.append(line)
+                if output_lines:
+                    # One write for the whole output instead of one per line
+                    print("\n".join(output_lines))
 
                 return output_lines
 
@@ -1,6 +1,10 @@
 # mssqlclient_ng/core/actions/factory.py
 
 # Built-in imports
+import importlib
+import json
+import pkgutil
+from pathlib import Path
 
 # Third party imports
 from loguru import logger
@@ -14,12 +18,25 @@ class ActionFactory:
     Uses a registry pattern to map action names to their classes and descriptions.
     """
 
-    # Action registry: maps action names to (class, description)
-    _registry: dict[str, tuple[type[BaseAction], str]] = {}
+    # Action registry: maps action names to (class, description).
+    # Entries seeded from the manifest hold a "module:Class" import path until
+    # the action is first needed.
+    _registry: dict[str, tuple[type[BaseAction] | str, str]] = {}
 
     # Alias registry: maps alias -> canonical action name
     _aliases: dict[str, str] = {}
 
+    # Help/search index, sorted by name: (action_name, lowercase "name\ndescription",
+    # preformatted help row). Built on first use, dropped whenever the registry changes.
+    _search_index: list[tuple[str, str, str]] | None = None
+
+    # Set once the manifest has been read into the registry (see _load_actions)
+    _actions_loaded: bool = False
+
+    # Precomputed {name: {description, aliases, module, class}} for every
+    # built-in action. Regenerate with scripts/build_action_manifest.py.
+    MANIFEST_PATH = Path(__file__).with_name("_manifest.json")
+
     @classmethod
     def register(cls, name: str, description: str, aliases: list[str] | None = None):
         """
@@ -40,10 +57,96 @@ class ActionFactory:
             if aliases:
                 for alias in aliases:
                     cls._aliases[alias.lower()] = name.lower()
+            cls._search_index = None
             return action_class
 
         return decorator
 
+    @classmethod
+    def _load_actions(cls) -> None:
+        """
+        Seed the registry from the action manifest.
+
+        Names, descriptions and aliases come from the manifest, so listing or
+        searching actions imports no action module; a module is only imported
+        when its class is needed. Falls back to importing every action
+        subpackage when the manifest is missing or unreadable.
+        """
+        if cls._actions_loaded:
+            return
+        cls._actions_loaded = True
+
+        try:
+            manifest = json.loads(cls.MANIFEST_PATH.read_text(encoding="utf-8"))
+            entries = [
+                (
+                    name,
+                    f"{entry['module']}:{entry['class']}",
+                    entry["description"],
+                    list(entry["aliases"]),
+                )
+                for name, entry in manifest.items()
+            ]
+        except FileNotFoundError:
+            logger.debug("Action manifest not found, importing every action")
+            cls._import_all_actions()
+            return
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.debug(f"Action manifest unreadable ({e}), importing every action")
+            cls._import_all_actions()
+            return
+
+        for name, import_path, description, aliases in entries:
+            # Actions already imported keep their real class
+            cls._registry.setdefault(name, (import_path, description))
+            for alias in aliases:
+                cls._aliases.setdefault(alias, name)
+        cls._search_index = None
+
+    @staticmethod
+    def _import_all_actions() -> None:
+        """Import every action module so their register() decorators run."""
+        from . import __all__ as subpackages
+
+        for subpackage in subpackages:
+            package = importlib.import_module(f"{__package__}.{subpackage}")
+            for module_info in pkgutil.iter_modules(package.__path__):
+                importlib.import_module(f"{package.__name__}.{module_info.name}")
+
+    @classmethod
+    def _get_action_class(cls, action_key: str) -> type[BaseAction]:
+        """Return the class registered under action_key, importing it if needed."""
+        action_class, description = cls._registry[action_key]
+        if isinstance(action_class, str):
+            module_name, _, class_name = action_class.partition(":")
+            action_class = getattr(importlib.import_module(module_name), class_name)
+            cls._registry[action_key] = (action_class, description)
+        return action_class
+
+    @classmethod
+    def build_manifest(cls) -> dict[str, dict]:
+        """
+        Import every action module and describe the resulting registry.
+
+        Returns:
+            dict mapping action name -> {description, aliases, module, class},
+            the content of the manifest file
+        """
+        cls._import_all_actions()
+
+        manifest = {}
+        for name, (action_class, description) in sorted(cls._registry.items()):
+            if isinstance(action_class, str):
+                # Stale manifest entry: no module registers this name anymore
+                continue
+            manifest[name] = {
+                "description": description,
+                "aliases": [a for a, c in cls._aliases.items() if c == name],
+                "module": action_class.__module__,
+                "class": action_class.__name__,
+            }
+        return manifest
+
     @classmethod
     def get_action(cls, action_type: str) -> BaseAction | None:
         """Get an action instance by name or alias.
@@ -54,6 +157,7 @@ class ActionFactory:
         Returns:
             An instance of the action, or None if not found
         """
+        cls._load_actions()
         action_key = action_type.lower()
 
         # Resolve alias
@@ -62,12 +166,12 @@ class ActionFactory:
         if action_key not in cls._registry:
             return None
 
-        action_class, _ = cls._registry[action_key]
-        return action_class()
+        return cls._get_action_class(action_key)()
 
     @classmethod
     def resolve_alias(cls, action_type: str) -> str:
         """Resolve an action name or alias to its canonical name."""
+        cls._load_actions()
         return cls._aliases.get(action_type.lower(), action_type.lower())
 
     @classmethod
@@ -78,11 +182,12 @@ class ActionFactory:
         Returns:
             list of tuples: (action_name, description, arguments)
         """
+        cls._load_actions()
         result = []
 
-        for name, (action_class, description) in cls._registry.items():
+        for name, (_, description) in list(cls._registry.items()):
             try:
-                action = action_class()
+                action = cls._get_action_class(name)()
                 getter = getattr(action, "get_arguments", None)
                 arguments = getter() if getter is not None else []
                 result.append((name, description, arguments))
@@ -103,6 +208,7 @@ class ActionFactory:
         Returns:
             The action description, or None if not found
         """
+        cls._load_actions()
         action_key = cls._aliases.get(action_name.lower(), action_name.lower())
         if action_key in cls._registry:
             return cls._registry[action_key][1]
@@ -116,8 +222,55 @@ class ActionFactory:
         Returns:
             list of action names
         """
+        cls._load_actions()
         return list(cls._registry.keys())
 
+    @classmethod
+    def get_help_rows(cls, term: str | None = None) -> list[str]:
+        """
+        Get the preformatted help listing rows for actions matching a keyword.
+
+        Each row reads "  name [aliases]    description", sorted by action
+        name.
+
+        Args:
+            term: Case-insensitive keyword; None or empty returns every action
+
+        Returns:
+            list of formatted rows
+        """
+        return [row for _, _, row in cls._matching_index_entries(term)]
+
+    @classmethod
+    def _matching_index_entries(
+        cls, term: str | None
+    ) -> list[tuple[str, str, str]]:
+        """Return search index entries matching term, building the index if needed."""
+        cls._load_actions()
+        if cls._search_index is None:
+            reverse_aliases: dict[str, list[str]] = {}
+            for alias, canonical in cls._aliases.items():
+                reverse_aliases.setdefault(canonical, []).append(alias)
+
+            index = []
+            for name, (_, description) in sorted(cls._registry.items()):
+                aliases = reverse_aliases.get(name)
+                label = f"{name} [{', '.join(aliases)}]" if aliases else name
+                index.append(
+                    (
+                        name,
+                        f"{name}\n{description}".lower(),
+                        f"  {label:<35}{description}",
+                    )
+                )
+            cls._search_index = index
+
+        if not term:
+            return cls._search_index
+
+        term_lower = term.lower()
+        return [entry for entry in cls._search_index if term_lower in entry[1]]
+
     @classmethod
     def action_exists(cls, action_name: str) -> bool:
         """
@@ -129,6 +282,7 @@ class ActionFactory:
         Returns:
             True if action exists, False otherwise
         """
+        cls._load_actions()
         key = action_name.lower()
         return key in cls._registry or key in cls._aliases
 
@@ -140,6 +294,7 @@ class ActionFactory:
         Returns:
             dict mapping alias -> canonical action name
         """
+        cls._load_actions()
         return dict(cls._aliases)
 
     @classmethod
@@ -150,11 +305,16 @@ class ActionFactory:
         E.g. mssqlclient_ng.core.actions.database.whoami -> "database"
         Falls back to "other" when the module structure is unexpected.
         """
+        cls._load_actions()
         key = cls._aliases.get(action_name.lower(), action_name.lower())
         if key not in cls._registry:
             return "other"
         action_class, _ = cls._registry[key]
-        parts = action_class.__module__.split(".")
+        if isinstance(action_class, str):
+            module_name = action_class.partition(":")[0]
+        else:
+            module_name = action_class.__module__
+        parts = module_name.split(".")
         try:
             idx = parts.index("actions")
             if idx + 1 < len(parts):
@@ -167,6 +327,9 @@ class ActionFactory:
     def clear_registry(cls) -> None:
         """Clear all registered actions. Mainly for testing."""
         cls._registry.clear()
+        cls._aliases.clear()
+        cls._search_index = None
+        cls._actions_loaded = False
 
     @classmethod
     def display_action_help(cls, action_name: str) -> None:
@@ -220,16 +383,14 @@ class ActionFactory:
                     usage_tokens.append(f"[{hint}]")
                 entries.append((raw, hint, arg))
 
-        print()
-        print(" ".join(usage_tokens))
+        # Assemble the whole help text and print it in a single write
+        lines = ["", " ".join(usage_tokens)]
         if aliases:
-            print(f"aliases: {', '.join(aliases)}")
-        print()
-        print(description)
+            lines.append(f"aliases: {', '.join(aliases)}")
+        lines += ["", description]
 
         if entries:
-            print()
-            print("options:")
+            lines += ["", "options:"]
             col = max(len(hint) for _, hint, _ in entries) + 4
             for _raw, hint, arg in entries:
                 desc = arg.description or ""
@@ -237,6 +398,7 @@ class ActionFactory:
                     desc += " (required)"
                 elif arg.default is not None and arg.default != "" and not arg.toggle:
                     desc += f" (default: {arg.default})"
-                print(f"  {hint:<{col}}{desc}")
+                lines.append(f"  {hint:<{col}}{desc}")
 
-        print()
+        lines.append("")
+        print("\n".join(lines))
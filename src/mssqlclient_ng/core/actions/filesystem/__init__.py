@@ -1,6 +1,13 @@
-from .file_read import FileRead
-from .remove_file import RemoveFile
-from .tree import Tree
-from .upload import Upload
+# Local library imports
+from ...utils.lazy import make_getattr
 
-__all__ = ["FileRead", "RemoveFile", "Tree", "Upload"]
+_EXPORTS = {
+    "FileRead": "file_read",
+    "RemoveFile": "remove_file",
+    "Tree": "tree",
+    "Upload": "upload",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__ = make_getattr(__name__, _EXPORTS)
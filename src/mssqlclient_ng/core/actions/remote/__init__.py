@@ -1,21 +1,19 @@
 # mssqlclient_ng/core/actions/remote/__init__.py
 
-from .smb_coerce import SmbCoerce
-from .links import Links
-from .rpc import RemoteProcedureCall
-from .data_access import DataAccess
-from .linkmap import LinkMap
-from .external_sources import ExternalSources
-from .external_credentials import ExternalCredentials
-from .external_tables import ExternalTables
+# Local library imports
+from ...utils.lazy import make_getattr
 
-__all__ = [
-    "SmbCoerce",
-    "Links",
-    "RemoteProcedureCall",
-    "DataAccess",
-    "LinkMap",
-    "ExternalSources",
-    "ExternalCredentials",
-    "ExternalTables",
-]
+_EXPORTS = {
+    "SmbCoerce": "smb_coerce",
+    "Links": "links",
+    "RemoteProcedureCall": "rpc",
+    "DataAccess": "data_access",
+    "LinkMap": "linkmap",
+    "ExternalSources": "external_sources",
+    "ExternalCredentials": "external_credentials",
+    "ExternalTables": "external_tables",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__ = make_getattr(__name__, _EXPORTS)
@@ -1140,7 +1140,8 @@ ORDER BY srv.provider, srv.modify_date DESC;"""
                 last_part = current_path[-1]
                 current_path[-1] = last_part + "/" + "/".join(imp_logins)
             else:
-                chain_part = f"({' \u2192 '.join(imp_logins)}) {node.alias}"
+                logins = " \u2192 ".join(imp_logins)
+                chain_part = f"({logins}) {node.alias}"
         current_path.append(chain_part)
 
         # Format display name
@@ -2,6 +2,7 @@
 
 # Built-in imports
 from enum import Enum
+from types import MappingProxyType
 from typing import Any
 
 # Third party imports
@@ -30,7 +31,7 @@ class RemoteProcedureCall(BaseAction):
     """
 
     # Mapping of all accepted aliases to their normalized action
-    ACTION_ALIASES = {
+    ACTION_ALIASES = MappingProxyType({
         "add": RpcActionMode.ENABLE,
         "on": RpcActionMode.ENABLE,
         "1": RpcActionMode.ENABLE,
@@ -41,7 +42,8 @@ class RemoteProcedureCall(BaseAction):
         "0": RpcActionMode.DISABLE,
         "false": RpcActionMode.DISABLE,
         "disable": RpcActionMode.DISABLE,
-    }
+    })
+    _VALID_ACTIONS = ", ".join(sorted(ACTION_ALIASES))
 
     _action_str = Arg(position=0, required=True, description="Action: enable/on/1/add or disable/off/0/del")
     _linked_server_name = Arg(position=1, required=True, description="Linked server name")
@@ -82,13 +84,12 @@ class RemoteProcedureCall(BaseAction):
         # Parse action mode using alias mapping
         action_str = positional_args[0].lower()
 
-        if action_str not in self.ACTION_ALIASES:
-            valid_actions = ", ".join(sorted(self.ACTION_ALIASES.keys()))
+        self._action = self.ACTION_ALIASES.get(action_str)
+        if self._action is None:
             raise ValueError(
-                f"Invalid action: '{positional_args[0]}'. Valid actions are: {valid_actions}"
+                f"Invalid action: '{positional_args[0]}'. Valid actions are: {self._VALID_ACTIONS}"
             )
 
-        self._action = self.ACTION_ALIASES[action_str]
         self._linked_server_name = positional_args[1]
 
         logger.info(
@@ -1,11 +1,14 @@
 # mssqlclient_ng/core/models/__init__.py
 
-from .server import Server
-from .server_execution_state import ServerExecutionState
-from .linked_servers import LinkedServers
-
-__all__ = [
-    "Server",
-    "ServerExecutionState",
-    "LinkedServers",
-]
+# Local library imports
+from ..utils.lazy import make_getattr
+
+_EXPORTS = {
+    "Server": "server",
+    "ServerExecutionState": "server_execution_state",
+    "LinkedServers": "linked_servers",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__ = make_getattr(__name__, _EXPORTS)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 # Built-in imports
+import re
 
 # Third party imports
 from loguru import logger
@@ -11,6 +12,14 @@ from loguru import logger
 from .server import Server
 from ..utils.common import bracket_identifier
 
+# Stands in for the final query while a chain template is built. It holds no
+# quote or semicolon, so the per-hop escaping passes it through untouched
+_QUERY_PLACEHOLDER = "\x00query\x00"
+
+# One chain hop: plain characters or a bracketed name, which may hold ';' and
+# runs to the end of the input when left unclosed
+_SEGMENT_RE = re.compile(r"(?:[^;\[]|\[[^\]]*(?:\]|$))+")
+
 
 class LinkedServers:
     """
@@ -57,8 +66,8 @@ class LinkedServers:
         # Remote Procedure Call (RPC) usage flag
         self.use_remote_procedure_call: bool = True
 
-        # Per-server RPC tracking: set of server names known to lack RPC
-        self._non_rpc_servers: set = set()
+        # Per-server RPC tracking: lowercased names of servers known to lack RPC
+        self._non_rpc_servers: set[str] = set()
 
     @property
     def is_empty(self) -> bool:
@@ -76,8 +85,7 @@ class LinkedServers:
         if not self._non_rpc_servers or not self._server_names:
             return False
         return all(
-            name.lower() in {s.lower() for s in self._non_rpc_servers}
-            for name in self._server_names
+            name.lower() in self._non_rpc_servers for name in self._server_names
         )
 
     def mark_server_as_non_rpc(self, server_name: str) -> None:
@@ -97,6 +105,9 @@ class LinkedServers:
 
     def _recompute_chain(self) -> None:
         """Recompute internal arrays (server names, impersonation users, databases)."""
+        # Chain wrappers built around _QUERY_PLACEHOLDER, keyed by builder
+        self._chain_templates: dict[object, str] = {}
+
         # Computable server names starts with "0" as convention
         self._computable_server_names: list[str] = ["0"] + [
             server.hostname for server in self.server_chain
@@ -279,35 +290,10 @@ class LinkedServers:
         if not chain_input or not chain_input.strip():
             raise ValueError("Server list cannot be null or empty.")
 
-        servers = []
-        current = chain_input.strip()
-
-        while current:
-            # Find the next semicolon, accounting for bracketed names
-            in_brackets = False
-            semicolon_pos = -1
-
-            for i, char in enumerate(current):
-                if char == "[":
-                    in_brackets = True
-                elif char == "]":
-                    in_brackets = False
-                elif char == ";" and not in_brackets:
-                    semicolon_pos = i
-                    break
-
-            if semicolon_pos == -1:
-                # Last server in chain
-                servers.append(Server.parse_server(current.strip()))
-                break
-            else:
-                # Extract this server and continue
-                server_string = current[:semicolon_pos].strip()
-                if server_string:
-                    servers.append(Server.parse_server(server_string))
-                current = current[semicolon_pos + 1 :].strip()
-
-        return servers
+        segments = (
+            segment.strip() for segment in _SEGMENT_RE.findall(chain_input)
+        )
+        return [Server.parse_server(segment) for segment in segments if segment]
 
     def build_select_openquery_chain(self, query: str) -> str:
         """
@@ -323,12 +309,16 @@ class LinkedServers:
         Returns:
             Nested OPENQUERY statement string
         """
-        return self._build_select_openquery_chain_recursive(
-            linked_servers=self._computable_server_names,
-            query=query,
-            linked_impersonation=self._computable_impersonation_names,
-            linked_databases=self._computable_database_names,
-        )
+        template = self._chain_templates.get("openquery")
+        if template is None:
+            template = self._build_select_openquery_chain_recursive(
+                linked_servers=self._computable_server_names,
+                query=_QUERY_PLACEHOLDER,
+                linked_impersonation=self._computable_impersonation_names,
+                linked_databases=self._computable_database_names,
+            )
+            self._chain_templates["openquery"] = template
+        return self._fill_chain_template(template, query)
 
     def _build_select_openquery_chain_recursive(
         self,
@@ -440,12 +430,31 @@ class LinkedServers:
         Returns:
             Nested EXEC AT statement string
         """
-        return self._build_remote_procedure_call_recursive(
-            linked_servers=self._computable_server_names,
-            query=query,
-            linked_impersonation=self._computable_impersonation_names,
-            linked_databases=self._computable_database_names,
-        )
+        template = self._chain_templates.get("rpc")
+        if template is None:
+            template = self._build_remote_procedure_call_recursive(
+                linked_servers=self._computable_server_names,
+                query=_QUERY_PLACEHOLDER,
+                linked_impersonation=self._computable_impersonation_names,
+                linked_databases=self._computable_database_names,
+            )
+            self._chain_templates["rpc"] = template
+        return self._fill_chain_template(template, query)
+
+    def _fill_chain_template(self, template: str, query: str) -> str:
+        """
+        Substitute the query into a chain template.
+
+        Every hop doubles the single quotes of everything it wraps, so the query
+        ends up with its quotes multiplied by 2 ** hops, whichever builder made
+        the template. Doing that once here replaces re-escaping the whole query
+        at each hop.
+        """
+        if template == _QUERY_PLACEHOLDER:
+            # Empty chain: nothing wraps the query
+            return query
+        escaped = query.rstrip(";").replace("'", "'" * (1 << len(self._server_names)))
+        return template.replace(_QUERY_PLACEHOLDER, escaped, 1)
 
     @staticmethod
     def _build_remote_procedure_call_recursive(
@@ -515,16 +524,26 @@ class LinkedServers:
         Returns:
             Nested hybrid statement string
         """
+        # The hop layout depends on which servers are known to lack RPC
+        cache_key = frozenset(self._non_rpc_servers)
+        template = self._chain_templates.get(cache_key)
+        if template is None:
+            template = self._build_hybrid_template()
+            self._chain_templates[cache_key] = template
+        return self._fill_chain_template(template, query)
+
+    def _build_hybrid_template(self) -> str:
+        """Build the hybrid chain wrapper around _QUERY_PLACEHOLDER."""
         linked_servers = self._computable_server_names
         linked_impersonation = self._computable_impersonation_names
         linked_databases = self._computable_database_names
 
-        current_query = query
+        current_query = _QUERY_PLACEHOLDER
 
         # Start from the end of the array and skip the first element ("0")
         for i in range(len(linked_servers) - 1, 0, -1):
             server = linked_servers[i]
-            is_rpc = server.lower() not in {s.lower() for s in self._non_rpc_servers}
+            is_rpc = server.lower() not in self._non_rpc_servers
 
             if is_rpc:
                 # EXEC AT path (same as full RPC builder per-hop)
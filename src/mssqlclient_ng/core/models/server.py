@@ -1,10 +1,14 @@
 # mssqlclient_ng/core/models/server.py
 
 # Built-in imports
+import re
 
 # Third party imports
 from loguru import logger
 
+# Component delimiters in a server string: port, impersonation user, database
+_DELIMITER_RE = re.compile(r"[:/@]")
+
 class Server:
     """
     Represents a SQL Server with optional cascading impersonation.
@@ -25,6 +29,18 @@ class Server:
     - @ = database context
     """
 
+    __slots__ = (
+        "hostname",
+        "_version",
+        "_major_version",
+        "port",
+        "database",
+        "_impersonation_users",
+        "mapped_user",
+        "system_user",
+        "is_azure_sql",
+    )
+
     def __init__(
         self,
         hostname: str,
@@ -52,6 +68,7 @@ class Server:
 
         self.hostname = hostname.strip()
         self._version: str | None = None
+        self._major_version = 0
         self.port = port or 1433
         self.database = database.strip() if database else None
 
@@ -75,23 +92,20 @@ class Server:
         Logs a warning if major version <= 13 (SQL Server 2016 or older).
         """
         self._version = value
+        self._major_version = self._parse_major_version(value) if value else 0
 
-        if value is not None:
-            major = self._parse_major_version(value)
-            if major <= 13 and major > 0:
-                logger.warning(
-                    f"Legacy server detected: version {value} (major version {major})"
-                )
+        if self.legacy:
+            logger.warning(
+                f"Legacy server detected: version {value} (major version {self._major_version})"
+            )
 
     @property
     def major_version(self) -> int:
         """
         The major version of the server (e.g., 15 for "15.00.2000").
-        Computed from the version string.
+        Parsed once when the version is set.
         """
-        if self._version is None:
-            return 0
-        return self._parse_major_version(self._version)
+        return self._major_version
 
     @property
     def legacy(self) -> bool:
@@ -99,7 +113,7 @@ class Server:
         Indicates whether this is a legacy server (SQL Server 2016 or older).
         Returns True if major version <= 13.
         """
-        return self.major_version <= 13 and self.major_version > 0
+        return 0 < self._major_version <= 13
 
     @staticmethod
     def _parse_major_version(version_string: str) -> int:
@@ -175,11 +189,10 @@ class Server:
             >>> server.hostname
             'SERVER:001'
         """
-        if not server_input or not server_input.strip():
+        remaining = server_input.strip() if server_input else ""
+        if not remaining:
             raise ValueError("Server input cannot be null or empty.")
 
-        remaining = server_input.strip()
-
         # Check if server name is bracketed (SQL identifier)
         hostname = None
         if remaining.startswith("["):
@@ -197,15 +210,9 @@ class Server:
             remaining = remaining[close_bracket + 1:]
         else:
             # Find the first delimiter to extract hostname
-            delimiters = {
-                ":": remaining.find(":"),
-                "/": remaining.find("/"),
-                "@": remaining.find("@"),
-            }
-
-            valid_delimiters = {k: v for k, v in delimiters.items() if v >= 0}
+            match = _DELIMITER_RE.search(remaining)
 
-            if not valid_delimiters:
+            if match is None:
                 # No delimiters, entire string is hostname
                 return cls(
                     hostname=remaining,
@@ -213,8 +220,7 @@ class Server:
                     database=database,
                 )
 
-            # Find first delimiter
-            first_delimiter_pos = min(valid_delimiters.values())
+            first_delimiter_pos = match.start()
             hostname = remaining[:first_delimiter_pos]
             remaining = remaining[first_delimiter_pos:]
 
@@ -236,23 +242,15 @@ class Server:
         # Parse all components
         while remaining:
             # Find next delimiter
-            delimiters = {
-                ":": remaining.find(":"),
-                "/": remaining.find("/"),
-                "@": remaining.find("@"),
-            }
+            match = _DELIMITER_RE.search(remaining)
 
-            valid_delimiters = {k: v for k, v in delimiters.items() if v >= 0}
-
-            if not valid_delimiters:
+            if match is None:
                 # Last component
                 next_delimiter_pos = len(remaining)
                 next_delimiter = None
             else:
-                next_delimiter_pos = min(valid_delimiters.values())
-                next_delimiter = next(
-                    k for k, v in valid_delimiters.items() if v == next_delimiter_pos
-                )
+                next_delimiter_pos = match.start()
+                next_delimiter = match.group()
 
             component = remaining[:next_delimiter_pos]
 
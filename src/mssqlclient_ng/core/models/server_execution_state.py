@@ -18,6 +18,8 @@ class ServerExecutionState:
         is_sysadmin: Whether the current user has sysadmin privileges
     """
 
+    __slots__ = ("hostname", "mapped_user", "system_user", "is_sysadmin")
+
     def __init__(
         self,
         hostname: str,
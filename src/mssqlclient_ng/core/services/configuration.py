@@ -372,6 +372,7 @@ class ConfigurationService:
                 f"Found {len(dependencies)} dependent objects for assembly '{assembly_name}'"
             )
 
+            drop_commands = []
             for row in dependencies:
                 object_type = row.get("type_desc", "")
                 object_name = row.get("name", "")
@@ -398,7 +399,11 @@ class ConfigurationService:
                 logger.debug(
                     f"Dropping dependent object '{object_name}' of type '{object_type}'"
                 )
-                self._query_service.execute_non_processing(drop_command)
+                drop_commands.append(drop_command)
+
+            # One batch for all drops instead of a round-trip per object
+            if drop_commands:
+                self._query_service.execute_non_processing("\n".join(drop_commands))
 
             logger.success(
                 f"All dependent objects for assembly '{assembly_name}' dropped successfully"
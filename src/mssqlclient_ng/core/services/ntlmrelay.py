@@ -3,6 +3,7 @@
 # Built-in imports
 import sys
 import threading
+from dataclasses import dataclass
 
 # Third party imports
 from loguru import logger
@@ -19,6 +20,15 @@ from ..utils.storage import get_data_dir
 from .database import DatabaseContext
 
 
+@dataclass(slots=True)
+class CapturedClient:
+    """An authenticated MSSQL relay client and the identity it was relayed for."""
+
+    client: MSSQLRelayClient
+    username: str
+    domain: str
+
+
 class RelayMSSQL:
     """
     NTLM Relay server for MSSQL authentication capture.
@@ -27,7 +37,7 @@ class RelayMSSQL:
 
     def __init__(self, hostname: str, port: int = 1433):
         self._threads: set = set()
-        self._captured_client: dict | None = None
+        self._captured_client: CapturedClient | None = None
         self._capture_event = threading.Event()
 
         minimal_protocol_clients = {"MSSQL": MSSQLRelayClient}
@@ -50,11 +60,9 @@ class RelayMSSQL:
                 logger.success(
                     f"Successfully relayed authentication for {self.domain}\\{self.username}"
                 )
-                relay_instance._captured_client = {
-                    "client": self.client,
-                    "username": self.username,
-                    "domain": self.domain,
-                }
+                relay_instance._captured_client = CapturedClient(
+                    client=self.client, username=self.username, domain=self.domain
+                )
                 relay_instance._capture_event.set()
                 return True
 
@@ -104,13 +112,14 @@ class RelayMSSQL:
 
         captured = self._capture_event.wait(timeout=timeout)
 
-        if not captured or self._captured_client is None:
+        captured_client = self._captured_client
+        if not captured or captured_client is None:
             logger.warning(f"No relayed connection received within {timeout}s")
             return None
 
-        mssql_client = self._captured_client["client"]
-        username = self._captured_client["username"]
-        domain = self._captured_client["domain"]
+        mssql_client = captured_client.client
+        username = captured_client.username
+        domain = captured_client.domain
 
         logger.success("Relayed connection captured")
         logger.trace(
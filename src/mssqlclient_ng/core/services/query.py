@@ -15,6 +15,16 @@ if TYPE_CHECKING:
 
 # Local library imports
 from ..models.linked_servers import LinkedServers
+from ..utils import common
+
+# Compiled once: _requires_rpc runs on every query sent through the service
+_EXEC_PREFIX_RE = re.compile(r"^EXEC(?:UTE)?\s+")
+_RPC_NOT_CONFIGURED_RE = re.compile(
+    r"Server '([^']+)' is not configured for RPC", re.IGNORECASE
+)
+_RPC_NOT_CONFIGURED_ALT_RE = re.compile(
+    r"(\S+) is not configured for RPC", re.IGNORECASE
+)
 
 class QueryService:
     """
@@ -40,8 +50,10 @@ class QueryService:
         # Dictionary to cache Azure SQL detection for each execution server
         self._is_azure_sql_cache: dict[str, bool] = {}
 
-        # Initialize execution server and database
-        self.execution_server = self._get_server_name()
+        # Initialize execution server and database. The host name is resolved
+        # once and restored whenever the linked server chain is cleared
+        self._base_server = self._get_server_name()
+        self.execution_server = self._base_server
         self.execution_database = self.get_current_database()
 
     @property
@@ -62,7 +74,7 @@ class QueryService:
         if not self._linked_servers.is_empty:
             self._compute_execution_server()
         else:
-            self.execution_server = self._get_server_name()
+            self.execution_server = self._base_server
             self.execution_database = self.get_current_database()
 
     @property
@@ -167,10 +179,9 @@ class QueryService:
         Returns:
             list of row dictionaries, one per result row.
         """
-        rows = self.execute(query, tuple_mode=False, silent=silent)
-        if not rows:
-            return []
-        return list(rows)
+        # execute() yields None when the connection is down or retries run
+        # out; impacket starts a new row list per batch, so none is copied
+        return self.execute(query, tuple_mode=False, silent=silent) or []
 
     def execute_scalar(self, query: str, silent: bool = False) -> Any | None:
         """
@@ -183,7 +194,8 @@ class QueryService:
         Returns:
             The scalar value, or None if no rows returned
         """
-        rows = self.execute(query, tuple_mode=False, silent=silent)
+        # Rows as lists: only the first cell is needed, so skip building dicts
+        rows = self.execute(query, tuple_mode=True, silent=silent)
 
         if rows:
             # Get first column value of first row
@@ -387,6 +399,26 @@ class QueryService:
             logger.exception("Unexpected error during query execution")
             raise
 
+    def parameterize(self, statement: str, **parameters: str) -> str:
+        """
+        Bind user-supplied string values to the @name parameters of a statement.
+
+        On a direct connection the statement runs through sp_executesql, so
+        SQL Server caches one plan for every value. Under a linked server chain
+        the batch is wrapped in OPENQUERY or EXEC AT, where an sp_executesql
+        rowset cannot be described, so the values are inlined as literals.
+
+        Args:
+            statement: T-SQL referencing each parameter as @name
+            **parameters: Parameter values by name
+
+        Returns:
+            The batch to pass to execute() and friends
+        """
+        if self._linked_servers.is_empty:
+            return common.sp_executesql(statement, **parameters)
+        return common.inline_parameters(statement, **parameters)
+
     def _prepare_query(self, query: str) -> str:
         """
         Prepare the final query by adding linked server logic if needed.
@@ -474,7 +506,7 @@ class QueryService:
             return False
 
         # Strip a leading EXEC/EXECUTE so "EXEC SP_CONFIGURE" is normalised to "SP_CONFIGURE"
-        exec_stripped = re.sub(r"^EXEC(?:UTE)?\s+", "", s)
+        exec_stripped = _EXEC_PREFIX_RE.sub("", s)
 
         # Commands that must start the (possibly EXEC-stripped) statement
         rpc_prefixes = [
@@ -542,20 +574,21 @@ class QueryService:
         Returns:
             Number of affected rows, or 0 if not available
         """
+        replies = self.mssql_instance.replies
 
-        affected = 0
+        # Statement-level counts first: DONEINPROC carries the rows touched by
+        # the statements inside EXEC/sp_executesql, while DONEPROC closing the
+        # procedure reports no count of its own and must not override it.
+        # Tokens are impacket Structures, which do not support "in": check the
+        # parsed fields dict instead
+        for token_type in (TDS_DONEINPROC_TOKEN, TDS_DONE_TOKEN, TDS_DONEPROC_TOKEN):
+            tokens = replies.get(token_type)
+            if tokens:
+                row_count = tokens[-1].fields.get("DoneRowCount")
+                if row_count is not None:
+                    return row_count
 
-        # Check for DONE tokens in replies
-        for token_type in [TDS_DONE_TOKEN, TDS_DONEINPROC_TOKEN, TDS_DONEPROC_TOKEN]:
-            if token_type in self.mssql_instance.replies:
-                tokens = self.mssql_instance.replies[token_type]
-                if tokens:
-                    # Get the last DONE token's row count
-                    last_token = tokens[-1]
-                    if "DoneRowCount" in last_token:
-                        affected = last_token["DoneRowCount"]
-
-        return affected
+        return 0
 
     def change_database(self, database: str) -> None:
         """
@@ -696,15 +729,11 @@ class QueryService:
         Returns:
             The server name, or None if it couldn't be parsed
         """
-        match = re.search(
-            r"Server '([^']+)' is not configured for RPC", error_message, re.IGNORECASE
-        )
+        match = _RPC_NOT_CONFIGURED_RE.search(error_message)
         if match:
             return match.group(1)
         # Alternate pattern: "server_name is not configured for RPC"
-        match = re.search(
-            r"(\S+) is not configured for RPC", error_message, re.IGNORECASE
-        )
+        match = _RPC_NOT_CONFIGURED_ALT_RE.search(error_message)
         if match:
             return match.group(1)
         return None
@@ -8,6 +8,49 @@ from loguru import logger
 # Local library imports
 from .query import QueryService
 
+_SERVER_ROLES_QUERY = """
+SELECT name, is_fixed_role
+FROM sys.server_principals
+WHERE type = 'R'
+  AND name != 'public'
+  AND name NOT LIKE '##%##'
+  AND ISNULL(IS_SRVROLEMEMBER(name), 0) = 1
+ORDER BY is_fixed_role DESC, name;"""
+
+_ACCESSIBLE_DATABASES_QUERY = (
+    "SELECT name FROM master.sys.databases WHERE HAS_DBACCESS(name) = 1;"
+)
+
+_DATABASE_ROLES_QUERY = """
+SELECT name
+FROM sys.database_principals
+WHERE type = 'R' AND ISNULL(IS_ROLEMEMBER(name), 0) = 1
+ORDER BY name;"""
+
+# Identity, server roles, accessible databases and database roles in one
+# round-trip. Kind tells the sections apart; Flag carries is_fixed_role.
+# Names come from catalogs with different collations, hence DATABASE_DEFAULT.
+_PROFILE_QUERY = """
+SELECT 'LOGIN' AS Kind, CONVERT(NVARCHAR(256), SYSTEM_USER) COLLATE DATABASE_DEFAULT AS Name, 0 AS Flag
+UNION ALL
+SELECT 'USER', CONVERT(NVARCHAR(256), USER_NAME()) COLLATE DATABASE_DEFAULT, 0
+UNION ALL
+SELECT 'SERVER_ROLE', name COLLATE DATABASE_DEFAULT, CONVERT(INT, is_fixed_role)
+FROM sys.server_principals
+WHERE type = 'R'
+  AND name != 'public'
+  AND name NOT LIKE '##%##'
+  AND ISNULL(IS_SRVROLEMEMBER(name), 0) = 1
+UNION ALL
+SELECT 'DATABASE', name COLLATE DATABASE_DEFAULT, 0
+FROM master.sys.databases
+WHERE HAS_DBACCESS(name) = 1
+UNION ALL
+SELECT 'DATABASE_ROLE', name COLLATE DATABASE_DEFAULT, 0
+FROM sys.database_principals
+WHERE type = 'R' AND ISNULL(IS_ROLEMEMBER(name), 0) = 1;"""
+
+
 class UserService:
     """
     Service for managing user information, role membership, and impersonation.
@@ -197,19 +240,10 @@ class UserService:
         Returns:
             tuple of (fixed_roles, custom_roles)
         """
-        query = """
-SELECT name, is_fixed_role
-FROM sys.server_principals
-WHERE type = 'R'
-  AND name != 'public'
-  AND name NOT LIKE '##%##'
-  AND ISNULL(IS_SRVROLEMEMBER(name), 0) = 1
-ORDER BY is_fixed_role DESC, name;"""
-
         fixed_roles: list[str] = []
         custom_roles: list[str] = []
         try:
-            rows = self._query_service.execute_table(query, silent=True)
+            rows = self._query_service.execute_table(_SERVER_ROLES_QUERY, silent=True)
             for row in rows:
                 name = str(row.get("name", ""))
                 is_fixed = row.get("is_fixed_role")
@@ -226,6 +260,100 @@ ORDER BY is_fixed_role DESC, name;"""
 
         return (fixed_roles, custom_roles)
 
+    def get_profile(self) -> dict[str, str | list[str]]:
+        """
+        Returns the current user's identity, server roles, accessible databases
+        and database roles, fetched in a single round-trip.
+        Like get_info() and get_server_roles(), also refreshes the identity and
+        the admin-status cache. If the batch fails (e.g. a catalog function is
+        unavailable on an older or linked server), each section is fetched on
+        its own so that one failing section does not empty the others.
+
+        Returns:
+            dict with keys mapped_user, system_user, fixed_roles, custom_roles,
+            databases and database_roles
+        """
+        try:
+            rows = self._query_service.execute_table(_PROFILE_QUERY, silent=True)
+        except Exception as e:
+            logger.debug(f"Batched profile query failed, querying each section: {e}")
+            return self._get_profile_by_section()
+
+        profile: dict[str, str | list[str]] = {
+            "mapped_user": "",
+            "system_user": "",
+            "fixed_roles": [],
+            "custom_roles": [],
+            "databases": [],
+            "database_roles": [],
+        }
+
+        for row in rows:
+            kind = row.get("Kind")
+            name = str(row.get("Name") or "")
+            if kind == "LOGIN":
+                profile["system_user"] = name
+            elif kind == "USER":
+                profile["mapped_user"] = name
+            elif kind == "SERVER_ROLE":
+                key = "fixed_roles" if row.get("Flag") == 1 else "custom_roles"
+                profile[key].append(name)
+            elif kind == "DATABASE":
+                profile["databases"].append(name)
+            elif kind == "DATABASE_ROLE":
+                profile["database_roles"].append(name)
+
+        # UNION ALL carries no ordering; sort roles as the dedicated queries do
+        profile["fixed_roles"].sort()
+        profile["custom_roles"].sort()
+        profile["database_roles"].sort()
+
+        self.mapped_user = profile["mapped_user"]
+        self.system_user = profile["system_user"]
+        self._admin_status_cache[self._query_service.execution_server] = any(
+            role.lower() == "sysadmin" for role in profile["fixed_roles"]
+        )
+
+        return profile
+
+    def _get_profile_by_section(self) -> dict[str, str | list[str]]:
+        """
+        Fetches each get_profile() section with its own query, tolerating
+        failures per section.
+        """
+        mapped_user, system_user = "", ""
+        try:
+            mapped_user, system_user = self.get_info()
+        except Exception as e:
+            logger.debug(f"Error retrieving user identity: {e}")
+
+        fixed_roles, custom_roles = self.get_server_roles()
+
+        databases: list[str] = []
+        try:
+            rows = self._query_service.execute_table(
+                _ACCESSIBLE_DATABASES_QUERY, silent=True
+            )
+            databases = [str(row["name"]) for row in rows]
+        except Exception as e:
+            logger.debug(f"Error retrieving accessible databases: {e}")
+
+        database_roles: list[str] = []
+        try:
+            rows = self._query_service.execute_table(_DATABASE_ROLES_QUERY, silent=True)
+            database_roles = [str(row["name"]) for row in rows]
+        except Exception as e:
+            logger.debug(f"Error retrieving database roles: {e}")
+
+        return {
+            "mapped_user": mapped_user,
+            "system_user": system_user,
+            "fixed_roles": fixed_roles,
+            "custom_roles": custom_roles,
+            "databases": databases,
+            "database_roles": database_roles,
+        }
+
     def _check_if_domain_user(self) -> bool:
         r"""
         Checks if the current system user is a Windows domain user.
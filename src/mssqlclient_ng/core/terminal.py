@@ -597,8 +597,12 @@ class Terminal:
                         handler(command_line)
                     continue
 
-                # Otherwise dispatch to action system
-                action_name, *args = shlex.split(command_line)
+                # Otherwise dispatch to action system; shlex is only needed
+                # when the line carries quotes or escapes
+                if any(char in command_line for char in "\"'\\"):
+                    action_name, *args = shlex.split(command_line)
+                else:
+                    action_name, *args = command_line.split()
                 self.execute_action(action_name, args)
 
     def _match_command(self, command_line: str) -> Callable[[str], None] | None:
@@ -659,15 +663,14 @@ class Terminal:
         # Find aliases for this command
         aliases = [k for k, v in self._BUILTIN_ALIASES.items() if v == cmd_name]
 
-        print()
-        print(f"Command: {cmd_name}")
+        lines = ["", f"Command: {cmd_name}"]
         if aliases:
-            print(f"Aliases: {', '.join(aliases)}")
-        print(f"Description: {summary}")
+            lines.append(f"Aliases: {', '.join(aliases)}")
+        lines.append(f"Description: {summary}")
         if detail:
-            print()
-            print(detail)
-        print()
+            lines += ["", detail]
+        lines.append("")
+        print("\n".join(lines))
 
     def _handle_help(self, command_line: str) -> None:
         """list actions or show help for a specific one: !help [action|term]"""
@@ -686,33 +689,14 @@ class Terminal:
             ActionFactory.display_action_help(term)
             return
 
-        # Build reverse alias map: canonical_name -> [alias, ]
-        reverse_aliases: dict[str, list[str]] = {}
-        for alias, canonical in ActionFactory.list_aliases().items():
-            reverse_aliases.setdefault(canonical, []).append(alias)
-
-        all_actions = sorted(ActionFactory.list_actions())
+        rows = ActionFactory.get_help_rows(term)
 
-        if term:
-            term_lower = term.lower()
-            all_actions = [
-                n
-                for n in all_actions
-                if term_lower in n
-                or term_lower in (ActionFactory.get_action_description(n) or "").lower()
-            ]
-            if not all_actions:
-                logger.warning(f"No actions matching '{term}'")
-                return
+        if term and not rows:
+            logger.warning(f"No actions matching '{term}'")
+            return
 
-        print()
-        for name in all_actions:
-            desc = ActionFactory.get_action_description(name) or ""
-            aliases = reverse_aliases.get(name, [])
-            alias_str = f" [{', '.join(aliases)}]" if aliases else ""
-            print(f"  {name + alias_str:<35}{desc}")
-        print()
-        logger.info(f"{len(all_actions)} action(s) — use !<action> --help for details")
+        print("\n".join(["", *rows, ""]))
+        logger.info(f"{len(rows)} action(s) — use !<action> --help for details")
 
     def _handle_debug(self, _command_line: str) -> None:
         """Toggle debug logging on/off.
@@ -3,6 +3,7 @@
 # Built-in imports
 import gzip
 import hashlib
+import re
 import secrets
 import socket
 import string
@@ -12,6 +13,10 @@ from base64 import b64decode
 # Third party imports
 from impacket.dcerpc.v5.dtypes import SID
 
+# A T-SQL @name placeholder; @@ system functions are left alone
+_PARAMETER_PATTERN = re.compile(r"(?<!@)@(\w+)")
+
+
 def generate_random_string(length: int) -> str:
     """
     Generate a random alphanumeric string.
@@ -262,3 +267,78 @@ def bracket_identifier(name: str) -> str:
     if any(char in name for char in (":", "/", "@", ";")):
         return f"[{name}]"
     return name
+
+def quote_identifier(name: str) -> str:
+    """
+    Bracket-quote a SQL Server identifier the way QUOTENAME() does.
+
+    Unlike bracket_identifier(), this always brackets and doubles any closing
+    bracket, so the result is safe to interpolate as a single identifier.
+
+    Examples:
+        >>> quote_identifier("my]db")
+        '[my]]db]'
+    """
+    return "[" + name.replace("]", "]]") + "]"
+
+
+def sp_executesql(statement: str, **parameters: str) -> str:
+    """
+    Build an sp_executesql call passing string values as NVARCHAR parameters.
+
+    The statement text is identical for every value, so SQL Server compiles it
+    once and reuses the cached plan. Quotes are doubled in all literals.
+
+    Args:
+        statement: T-SQL referencing each parameter as @name
+        **parameters: Parameter values by name
+
+    Returns:
+        The EXEC sp_executesql batch
+
+    Examples:
+        >>> sp_executesql("SELECT name FROM sys.server_principals WHERE name = @n;", n="sa")
+        "EXEC sp_executesql N'SELECT name FROM sys.server_principals WHERE name = @n;', N'@n NVARCHAR(4000)', @n = N'sa';"
+    """
+    declarations = ", ".join(f"@{name} NVARCHAR(4000)" for name in parameters)
+    assignments = ", ".join(
+        f"@{name} = {_nvarchar_literal(value)}" for name, value in parameters.items()
+    )
+    return (
+        f"EXEC sp_executesql {_nvarchar_literal(statement)}, "
+        f"N'{declarations}', {assignments};"
+    )
+
+
+def inline_parameters(statement: str, **parameters: str) -> str:
+    """
+    Substitute each @name in a statement with its value as an N'...' literal.
+
+    The plain-SQL counterpart of sp_executesql(), for batches that cannot go
+    through sp_executesql. Quotes are doubled in every value.
+
+    Args:
+        statement: T-SQL referencing each parameter as @name
+        **parameters: Parameter values by name
+
+    Returns:
+        The statement with every parameter inlined
+
+    Examples:
+        >>> inline_parameters("SELECT name FROM sys.server_principals WHERE name = @n;", n="sa")
+        "SELECT name FROM sys.server_principals WHERE name = N'sa';"
+    """
+    if not parameters:
+        return statement
+
+    def replace(match: re.Match) -> str:
+        name = match[1]
+        return _nvarchar_literal(parameters[name]) if name in parameters else match[0]
+
+    return _PARAMETER_PATTERN.sub(replace, statement)
+
+
+def _nvarchar_literal(value: str) -> str:
+    """Quote a string as an N'...' literal, doubling embedded single quotes."""
+    escaped = value.replace("'", "''")
+    return f"N'{escaped}'"
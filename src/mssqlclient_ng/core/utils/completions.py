@@ -1,6 +1,7 @@
 # mssqlclient_ng/core/utils/completions.py
 
 # Built-in imports
+from bisect import bisect_left
 from typing import Callable
 
 # External library imports
@@ -313,6 +314,11 @@ class ActionCompleter(Completer):
         self.prefix = prefix
         self._chain_loader = chain_loader
 
+        # Sorted action names and their descriptions, built on first completion
+        # (the registry is fixed once the shell is running)
+        self._action_names: list[str] | None = None
+        self._action_descriptions: list[str] = []
+
         # Built-in commands with descriptions
         self.builtins = {
             "help": "list actions or show help for a specific action/command",
@@ -379,33 +385,35 @@ class ActionCompleter(Completer):
                 yield from self._action_arg_completions(cmd, arg_prefix)
                 return
 
-            # Get all available actions
-            actions = ActionFactory.list_actions()
+            command_lower = command_part.lower()
 
-            # Filter actions that match what the user has typed
-            for action_name in actions:
-                if action_name.startswith(command_part.lower()):
-                    completion_text = action_name[len(command_part) :]
-                    description = (
-                        ActionFactory.get_action_description(action_name) or ""
-                    )
-                    yield Completion(completion_text, 0, display_meta=description)
+            # Matching actions form a contiguous run in the sorted name list
+            names = self._get_action_names()
+            index = bisect_left(names, command_lower)
+            while index < len(names) and names[index].startswith(command_lower):
+                completion_text = names[index][len(command_part) :]
+                yield Completion(
+                    completion_text,
+                    0,
+                    display_meta=self._action_descriptions[index],
+                )
+                index += 1
 
             # Also suggest action aliases
             for alias, canonical in ActionFactory.list_aliases().items():
-                if alias.startswith(command_part.lower()):
+                if alias.startswith(command_lower):
                     completion_text = alias[len(command_part) :]
                     yield Completion(completion_text, 0, display_meta=f"→ {canonical}")
 
             # Also suggest built-in commands
             for builtin_name, builtin_desc in self.builtins.items():
-                if builtin_name.startswith(command_part.lower()):
+                if builtin_name.startswith(command_lower):
                     completion_text = builtin_name[len(command_part) :]
                     yield Completion(completion_text, 0, display_meta=builtin_desc)
 
             # Also suggest built-in command aliases
             for alias, canonical in self.aliases.items():
-                if alias.startswith(command_part.lower()):
+                if alias.startswith(command_lower):
                     completion_text = alias[len(command_part) :]
                     yield Completion(
                         completion_text,
@@ -413,6 +421,16 @@ class ActionCompleter(Completer):
                         display_meta=f"→ !{canonical}",
                     )
 
+    def _get_action_names(self) -> list[str]:
+        """Return sorted action names, building the index on first use."""
+        if self._action_names is None:
+            names = sorted(ActionFactory.list_actions())
+            self._action_descriptions = [
+                ActionFactory.get_action_description(name) or "" for name in names
+            ]
+            self._action_names = names
+        return self._action_names
+
     def _help_completions(self, arg_prefix: str):
         """Yield completions for !help <name>: actions + built-in commands."""
         prefix_lower = arg_prefix.lower()
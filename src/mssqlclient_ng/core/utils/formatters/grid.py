@@ -94,27 +94,20 @@ class GridFormatter(IOutputFormatter):
         if not columns:
             return "No data available."
 
-        column_widths = {}
-        for col in columns:
-            col_name = col if col else "column"
-            column_widths[col] = len(col_name)
-
-        for row in data:
-            for col in columns:
-                value = self._format_value(row.get(col))
-                column_widths[col] = max(column_widths[col], len(value))
-
-        widths = [column_widths[col] for col in columns]
         headers = [col if col else "column" for col in columns]
 
+        # Format every cell once; widths and rendering both reuse the strings
+        format_value = self._format_value
+        cells = [[format_value(row.get(col)) for col in columns] for row in data]
+        widths = [max(map(len, column)) for column in zip(headers, *cells)]
+
         lines = [
             self._top_border(widths),
             self._row(headers, widths),
             self._mid_border(widths),
         ]
 
-        for row in data:
-            values = [self._format_value(row.get(col)) for col in columns]
+        for values in cells:
             lines.append(self._row(values, widths))
 
         lines.append(self._bot_border(widths))
@@ -75,35 +75,24 @@ class MarkdownFormatter(IOutputFormatter):
         if not columns:
             return "No data available."
 
-        # Calculate column widths
-        column_widths = {}
-        for col in columns:
-            col_name = col if col else "column"
-            column_widths[col] = len(col_name)
+        headers = [col if col else "column" for col in columns]
 
-        for row in data:
-            for col in columns:
-                value = self._format_value(row.get(col))
-                column_widths[col] = max(column_widths[col], len(value))
+        # Format every cell once; widths and rendering both reuse the strings
+        format_value = self._format_value
+        cells = [[format_value(row.get(col)) for col in columns] for row in data]
+        widths = [max(map(len, column)) for column in zip(headers, *cells)]
 
         # Header
-        header_parts = []
-        separator_parts = []
-        for col in columns:
-            col_name = col if col else "column"
-            header_parts.append(col_name.ljust(column_widths[col]))
-            separator_parts.append("-" * column_widths[col])
-
-        lines.append("| " + " | ".join(header_parts) + " |")
-        lines.append("| " + " | ".join(separator_parts) + " |")
+        lines.append(
+            "| " + " | ".join(h.ljust(w) for h, w in zip(headers, widths)) + " |"
+        )
+        lines.append("| " + " | ".join("-" * w for w in widths) + " |")
 
         # Rows
-        for row in data:
-            row_parts = []
-            for col in columns:
-                value = self._format_value(row.get(col))
-                row_parts.append(value.ljust(column_widths[col]))
-            lines.append("| " + " | ".join(row_parts) + " |")
+        for values in cells:
+            lines.append(
+                "| " + " | ".join(v.ljust(w) for v, w in zip(values, widths)) + " |"
+            )
 
         return "\n" + "\n".join(lines) + "\n"
 
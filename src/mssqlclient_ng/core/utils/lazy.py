@@ -0,0 +1,49 @@
+# mssqlclient_ng/core/utils/lazy.py
+
+"""
+Lazy package re-exports (PEP 562).
+
+The action and model packages re-export their classes without importing the
+defining modules up front. Importing an action module registers the action
+with ActionFactory, and the factory already resolves actions through its
+manifest, so a package-level import of every module would only add startup
+cost. Each package instead declares an ``_EXPORTS`` map and binds
+``__getattr__ = make_getattr(__name__, _EXPORTS)``; a name is imported on
+first access and then cached on the package.
+"""
+
+# Built-in imports
+import importlib
+import sys
+from typing import Any, Callable
+
+
+def make_getattr(
+    package: str, exports: dict[str, str | None]
+) -> Callable[[str], Any]:
+    """
+    Build a module-level __getattr__ for lazy package re-exports.
+
+    Args:
+        package: The package's __name__
+        exports: Mapping of exported name to the submodule defining it, or to
+            None when the name is itself a submodule of the package
+
+    Returns:
+        The function to bind as the package's __getattr__
+    """
+
+    def __getattr__(name: str) -> Any:
+        if name not in exports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        module_name = exports[name]
+        if module_name is None:
+            value = importlib.import_module(f".{name}", package)
+        else:
+            value = getattr(importlib.import_module(f".{module_name}", package), name)
+
+        setattr(sys.modules[package], name, value)
+        return value
+
+    return __getattr__
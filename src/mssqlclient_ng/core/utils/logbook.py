@@ -36,10 +36,8 @@ from pathlib import Path
 # Third party library imports
 from loguru import logger
 
-def _format_message(record):
-    """Custom formatter with compact symbols and colors."""
-    level_name = record["level"].name
-
+def _build_level_templates() -> dict[str | None, str]:
+    """Build the console format template for every level (None: unknown level)."""
     # Modern color palette (hex colors for better terminal support)
     trace_brown = "#8b7355"
     debug_blue = "#6c9bd1"
@@ -62,18 +60,28 @@ def _format_message(record):
             f"<fg {critical_magenta}><bold>[!!]</bold></fg {critical_magenta}>",
             critical_magenta,
         ),
+        None: ("[?]", "white"),
     }
 
-    symbol, color = symbols.get(level_name, ("[?]", "white"))
-
     # Professional format: full UTC timestamp + symbol + message
-    # Note: We must return a string template, not format it yet
-    return (
-        f"<fg {time_gray}>{{time:YYYY-MM-DD HH:mm:ss.SSS!UTC}} (UTC)</fg {time_gray}> "
-        f"{symbol} "
-        f"<fg {color}>{{message}}</fg {color}>"
-        "\n{exception}"
-    )
+    # Note: these are loguru templates, formatted per record by loguru itself
+    return {
+        level_name: (
+            f"<fg {time_gray}>{{time:YYYY-MM-DD HH:mm:ss.SSS!UTC}} (UTC)</fg {time_gray}> "
+            f"{symbol} "
+            f"<fg {color}>{{message}}</fg {color}>"
+            "\n{exception}"
+        )
+        for level_name, (symbol, color) in symbols.items()
+    }
+
+
+_LEVEL_TEMPLATES = _build_level_templates()
+
+
+def _format_message(record):
+    """Custom formatter with compact symbols and colors."""
+    return _LEVEL_TEMPLATES.get(record["level"].name, _LEVEL_TEMPLATES[None])
 
 # Tracks active handler IDs so set_level can replace them without noise
 _stderr_handler_id: int | None = None
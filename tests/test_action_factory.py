@@ -2,10 +2,12 @@
 
 """Tests for ActionFactory — registration, aliases, lookup, and clearing."""
 
+import json
+
 import pytest
 
 from mssqlclient_ng.core.actions.factory import ActionFactory
-from mssqlclient_ng.core.actions.base import BaseAction
+from mssqlclient_ng.core.actions.base import Arg, BaseAction
 
 # ── Fixtures ────────────────────────────────────────────────────────────
 
@@ -75,7 +77,10 @@ class TestActionFactoryRegistration:
 
     def test_clear_registry(self):
         ActionFactory.register("test-clear", "Will be cleared")(DummyAction)
+        ActionFactory._aliases["tclear"] = "test-clear"
         ActionFactory.clear_registry()
+        assert ActionFactory._actions_loaded is False
+        assert "tclear" not in ActionFactory._aliases
         assert ActionFactory.get_action("test-clear") is None
         # Restore for teardown
         ActionFactory._registry = dict(self._original_registry)
@@ -109,6 +114,55 @@ class TestActionFactoryAliases:
         assert aliases["a1"] == "target1"
 
 
+class TestActionFactorySearch:
+    """Test keyword search over the registry."""
+
+    def setup_method(self):
+        self._original_registry = dict(ActionFactory._registry)
+        self._original_aliases = dict(ActionFactory._aliases)
+        ActionFactory._search_index = None
+
+    def teardown_method(self):
+        ActionFactory._registry = self._original_registry
+        ActionFactory._aliases = self._original_aliases
+        ActionFactory._search_index = None
+
+    @staticmethod
+    def _names(rows):
+        return [row.split()[0] for row in rows]
+
+    def test_no_term_lists_all_sorted(self):
+        names = self._names(ActionFactory.get_help_rows())
+        assert names == sorted(ActionFactory.list_actions())
+
+    def test_matches_name(self):
+        ActionFactory.register("test-zebra", "Striped")(DummyAction)
+        assert "test-zebra" in self._names(ActionFactory.get_help_rows("ZEBRA"))
+
+    def test_matches_description(self):
+        ActionFactory.register("test-desc-search", "Finds Needle in haystack")(
+            DummyAction
+        )
+        rows = ActionFactory.get_help_rows("needle")
+        assert self._names(rows) == ["test-desc-search"]
+
+    def test_index_refreshed_on_register(self):
+        assert ActionFactory.get_help_rows("test-late") == []
+        ActionFactory.register("test-late", "Registered after first search")(
+            DummyAction
+        )
+        assert self._names(ActionFactory.get_help_rows("test-late")) == ["test-late"]
+
+    def test_help_row_includes_aliases(self):
+        ActionFactory.register("test-row", "Row description", aliases=["trow"])(
+            DummyAction
+        )
+        rows = ActionFactory.get_help_rows("test-row")
+        assert len(rows) == 1
+        assert rows[0].startswith("  test-row [trow]")
+        assert rows[0].endswith("Row description")
+
+
 class TestActionFactoryDecorator:
     """Test the @ActionFactory.register decorator."""
 
@@ -147,6 +201,49 @@ class TestActionFactoryDecorator:
         assert ActionFactory.get_action("talias") is not None
 
 
+class TestActionManifest:
+    """Test the precomputed action manifest."""
+
+    def setup_method(self):
+        self._original_registry = dict(ActionFactory._registry)
+        self._original_aliases = dict(ActionFactory._aliases)
+
+    def teardown_method(self):
+        ActionFactory._registry = self._original_registry
+        ActionFactory._aliases = self._original_aliases
+
+    def test_manifest_is_up_to_date(self):
+        on_disk = json.loads(ActionFactory.MANIFEST_PATH.read_text(encoding="utf-8"))
+        assert on_disk == ActionFactory.build_manifest(), (
+            "Action manifest is stale, run: uv run python scripts/build_action_manifest.py"
+        )
+
+    def test_unreadable_manifest_falls_back_to_import_scan(self, tmp_path, monkeypatch):
+        manifest = tmp_path / "_manifest.json"
+        manifest.write_text("{not json", encoding="utf-8")
+        monkeypatch.setattr(ActionFactory, "MANIFEST_PATH", manifest)
+        monkeypatch.setattr(ActionFactory, "_actions_loaded", False)
+        imported = []
+        monkeypatch.setattr(
+            ActionFactory, "_import_all_actions", lambda: imported.append(True)
+        )
+
+        ActionFactory._load_actions()
+
+        assert imported == [True]
+
+    def test_lazy_entry_resolved_on_first_use(self):
+        from mssqlclient_ng.core.actions.database.whoami import Whoami
+
+        ActionFactory._registry["test-lazy"] = (
+            "mssqlclient_ng.core.actions.database.whoami:Whoami",
+            "Lazy entry",
+        )
+        assert ActionFactory.get_action_category("test-lazy") == "database"
+        assert isinstance(ActionFactory.get_action("test-lazy"), Whoami)
+        assert ActionFactory._registry["test-lazy"][0] is Whoami
+
+
 class TestBuiltinActionsRegistered:
     """Smoke tests ensuring core actions are loaded by import."""
 
@@ -237,3 +334,55 @@ class TestArgDescriptorConvention:
                 f"but declares no Arg descriptors. "
                 f"Add Arg() class-level fields or remove the empty override."
             )
+
+
+class TestSplitArguments:
+    """split_arguments must match shlex on both the fast and the quoted path."""
+
+    @pytest.mark.parametrize(
+        "raw, expected",
+        [
+            ("", []),
+            ("   ", []),
+            ("users  dbo , 10", ["users", "dbo", "10"]),
+            ('"my table" dbo', ["my table", "dbo"]),
+            ("it\\'s x", ["it's", "x"]),
+            ('"  padded  " x', ["padded", "x"]),
+        ],
+    )
+    def test_split(self, raw, expected):
+        assert DummyAction().split_arguments(raw) == expected
+
+
+class TestParseActionArguments:
+    """Flag classification for --long=value, --long value, -x value and positionals."""
+
+    @pytest.mark.parametrize(
+        "parts, expected",
+        [
+            (["--limit=5", "x"], ({"limit": "5"}, ["x"])),
+            (["--limit", "5", "x"], ({"limit": "5"}, ["x"])),
+            (["-l", "5"], ({"l": "5"}, [])),
+            (["-l", "-v"], ({"l": "", "v": ""}, [])),
+            (["--a=b=c"], ({"a": "b=c"}, [])),
+            (["-1", "-ab", "-"], ({}, ["-1", "-ab", "-"])),
+            (["--flag", "-1"], ({"flag": "-1"}, [])),
+        ],
+    )
+    def test_parse(self, parts, expected):
+        assert DummyAction()._parse_action_arguments(argument_list=parts) == expected
+
+
+class TestArgFieldsCache:
+    """_get_arg_fields is computed once per class, never shared with subclasses."""
+
+    def test_cached_per_class(self):
+        class Parent(DummyAction):
+            _name = Arg(position=0)
+
+        class Child(Parent):
+            _limit = Arg(long_name="limit", default=5)
+
+        assert Parent._get_arg_fields() is Parent._get_arg_fields()
+        assert list(Parent._get_arg_fields()) == ["_name"]
+        assert list(Child._get_arg_fields()) == ["_name", "_limit"]
@@ -2,9 +2,11 @@
 
 """Tests for CLI argument parsing via build_parser()."""
 
+import argparse
+
 import pytest
 
-from mssqlclient_ng.cli import build_parser
+from mssqlclient_ng.cli import VALUE_OPTIONS, build_parser, split_action_argv
 
 
 @pytest.fixture
@@ -12,6 +14,10 @@ def parser():
     return build_parser()
 
 
+def test_parser_built_once():
+    assert build_parser() is build_parser()
+
+
 class TestCliTargetArguments:
     """Test required and optional target arguments."""
 
@@ -101,6 +107,74 @@ class TestCliActions:
         args = parser.parse_args(["SQL01", "-a", "xp-cmd", "dir C:\\"])
         assert args.action == ["xp-cmd", "dir C:\\"]
 
+    def test_split_action_argv_short_flag(self):
+        cli_argv, action_argv = split_action_argv(
+            ["SQL01", "-u", "sa", "-a", "xp-cmd", "-l", "dir C:\\"]
+        )
+        assert cli_argv == ["SQL01", "-u", "sa"]
+        assert action_argv == ["xp-cmd", "-l", "dir C:\\"]
+
+    def test_split_action_argv_long_flag(self):
+        cli_argv, action_argv = split_action_argv(["SQL01", "--action", "whoami"])
+        assert cli_argv == ["SQL01"]
+        assert action_argv == ["whoami"]
+
+    def test_split_action_argv_abbreviated_flag(self):
+        _, action_argv = split_action_argv(["SQL01", "--act", "whoami"])
+        assert action_argv == ["whoami"]
+
+    def test_split_action_argv_equals(self):
+        _, action_argv = split_action_argv(["SQL01", "--action=tables", "master"])
+        assert action_argv == ["tables", "master"]
+
+    def test_split_action_argv_absent(self):
+        cli_argv, action_argv = split_action_argv(["SQL01", "--app-name", "x"])
+        assert cli_argv == ["SQL01", "--app-name", "x"]
+        assert action_argv is None
+
+    def test_split_action_argv_skips_password_value(self, parser):
+        cli_argv, action_argv = split_action_argv(
+            ["SQL01", "-p", "-a", "-a", "whoami"]
+        )
+        assert action_argv == ["whoami"]
+        assert parser.parse_args(cli_argv).password == "-a"
+
+    def test_split_action_argv_skips_query_value(self, parser):
+        cli_argv, action_argv = split_action_argv(["SQL01", "-q", "-a"])
+        assert action_argv is None
+        assert parser.parse_args(cli_argv).query == "-a"
+
+    def test_split_action_argv_skips_abbreviated_option_value(self, parser):
+        cli_argv, action_argv = split_action_argv(
+            ["SQL01", "--pass", "--action", "--act", "whoami"]
+        )
+        assert action_argv == ["whoami"]
+        assert parser.parse_args(cli_argv).password == "--action"
+
+    @pytest.mark.parametrize(
+        "token", ["-ainfo", "-a=info", "--act=info", "--action=info"]
+    )
+    def test_split_action_argv_inline_value(self, token):
+        cli_argv, action_argv = split_action_argv(["SQL01", token, "master"])
+        assert cli_argv == ["SQL01"]
+        assert action_argv == ["info", "master"]
+
+    def test_value_options_match_parser(self, parser):
+        expected = {
+            option: action.nargs
+            for action in parser._actions
+            for option in action.option_strings
+            if action.nargs not in (0, argparse.REMAINDER)
+        }
+        assert VALUE_OPTIONS == expected
+
+    def test_split_action_argv_flag_after_switch(self):
+        cli_argv, action_argv = split_action_argv(
+            ["SQL01", "-windows-auth", "-a", "whoami"]
+        )
+        assert cli_argv == ["SQL01", "-windows-auth"]
+        assert action_argv == ["whoami"]
+
     def test_output_format_default(self, parser):
         args = parser.parse_args(["SQL01"])
         assert args.output_format == "markdown"
@@ -192,3 +266,94 @@ class TestCliNtlmRelay:
     def test_smb2support(self, parser):
         args = parser.parse_args(["SQL01", "-smb2support"])
         assert args.smb2support is True
+
+
+class TestMainInformationalFlags:
+    """--version and --help exit cleanly before any session setup."""
+
+    def test_version(self, monkeypatch, capsys):
+        from mssqlclient_ng import __version__, cli
+
+        monkeypatch.setattr("sys.argv", ["mssqlclient-ng", "--version"])
+        assert cli.main() == 0
+        assert capsys.readouterr().out.strip() == f"mssqlclient-ng {__version__}"
+
+    def test_version_does_not_build_parser(self, monkeypatch, capsys):
+        from mssqlclient_ng import cli
+
+        cli.build_parser.cache_clear()
+        monkeypatch.setattr("sys.argv", ["mssqlclient-ng", "SQL01", "--version"])
+        assert cli.main() == 0
+        assert cli.build_parser.cache_info().currsize == 0
+
+    def test_version_as_option_value_is_not_the_flag(self):
+        cli_argv, _ = split_action_argv(["SQL01", "-p", "--version"])
+        assert "--version" not in cli_argv
+        assert build_parser().parse_args(cli_argv).password == "--version"
+
+    def test_help_exit_code(self, monkeypatch, capsys):
+        from mssqlclient_ng import cli
+
+        monkeypatch.setattr("sys.argv", ["mssqlclient-ng", "--help"])
+        assert cli.main() == 0
+        assert "usage:" in capsys.readouterr().out
+
+
+class TestMainIdentityRefresh:
+    """The post-impersonation identity lookup runs only when it is read."""
+
+    @pytest.fixture
+    def context(self, monkeypatch):
+        from unittest.mock import MagicMock
+
+        from mssqlclient_ng.core.actions.execution import query
+        from mssqlclient_ng.core.services import authentication, database
+        from mssqlclient_ng.core.utils import logbook
+
+        ctx = MagicMock()
+        ctx.pre_impersonation_system = "CORP\\alice"
+        ctx.pre_impersonation_user = "alice"
+        ctx.user_service.get_info.return_value = ("dbo", "sa")
+
+        def make_context(server, mssql_instance):
+            ctx.server = server
+            return ctx
+
+        monkeypatch.setattr(logbook, "setup_logging", MagicMock())
+        monkeypatch.setattr(authentication, "AuthenticationService", MagicMock())
+        monkeypatch.setattr(database, "DatabaseContext", make_context)
+        monkeypatch.setattr(query, "Query", MagicMock())
+        return ctx
+
+    def _run(self, monkeypatch, *extra):
+        from mssqlclient_ng import cli
+
+        monkeypatch.setattr(
+            "sys.argv",
+            [
+                "mssqlclient-ng",
+                "SQL01/admin",
+                "-u",
+                "alice",
+                "-p",
+                "x",
+                "-q",
+                "SELECT 1",
+                *extra,
+            ],
+        )
+        return cli.main()
+
+    def test_identity_refreshed_by_default(self, monkeypatch, context):
+        assert self._run(monkeypatch) == 0
+        context.user_service.get_info.assert_called_once()
+        assert context.server.system_user == "sa"
+
+    def test_quiet_one_shot_query_skips_refresh(self, monkeypatch, context):
+        assert self._run(monkeypatch, "--log-level", "WARNING") == 0
+        context.user_service.get_info.assert_not_called()
+        assert context.server.system_user == "CORP\\alice"
+
+    def test_quiet_action_still_refreshes(self, monkeypatch, context):
+        self._run(monkeypatch, "--log-level", "WARNING", "-a", "whoami")
+        context.user_service.get_info.assert_called_once()
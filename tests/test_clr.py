@@ -0,0 +1,86 @@
+# tests/test_clr.py
+
+"""Tests for the CLR action's assembly encoding."""
+
+import hashlib
+from unittest.mock import MagicMock
+
+from mssqlclient_ng.core.actions.execution import clr
+from mssqlclient_ng.core.actions.execution.clr import ClrExecution
+
+
+class TestConvertDllToSqlBytes:
+    def test_hash_and_hex_match_whole_file_encoding(self, tmp_path, monkeypatch):
+        # A tiny chunk size forces several reads, including a short last one
+        monkeypatch.setattr(clr, "_READ_CHUNK_SIZE", 7)
+        data = bytes(range(256)) * 3
+        dll = tmp_path / "payload.dll"
+        dll.write_bytes(data)
+
+        library_hash, library_hex = ClrExecution()._convert_dll_to_sql_bytes(str(dll))
+
+        assert library_hash == hashlib.sha512(data).hexdigest()
+        assert library_hex == data.hex().upper()
+
+    def test_missing_file_returns_empty_pair(self, tmp_path):
+        missing = tmp_path / "missing.dll"
+        assert ClrExecution()._convert_dll_to_sql_bytes(str(missing)) == ("", "")
+
+
+class TestCleanup:
+    def _action(self, tmp_path):
+        dll = tmp_path / "payload.dll"
+        dll.write_bytes(b"MZ" + bytes(64))
+        action = ClrExecution()
+        action.validate_arguments(f"{dll} StoredProcedures Main")
+        return action
+
+    def test_failure_before_create_skips_drops(self, tmp_path):
+        ctx = MagicMock()
+        ctx.config_service.set_configuration_option.return_value = True
+        ctx.config_service.register_trusted_assembly.return_value = False
+        ctx.server.legacy = True
+        ctx.query_service.execute_scalar.return_value = 0
+        # Enabling TRUSTWORTHY fails, so nothing was created
+        ctx.query_service.execute_non_processing.side_effect = RuntimeError("denied")
+
+        assert self._action(tmp_path).execute(ctx) is False
+
+        sent = [c.args[0] for c in ctx.query_service.execute_non_processing.call_args_list]
+        assert not any(q.startswith("DROP") for q in sent)
+
+    def test_created_objects_are_dropped(self, tmp_path):
+        ctx = MagicMock()
+        ctx.config_service.set_configuration_option.return_value = True
+        ctx.config_service.register_trusted_assembly.return_value = True
+        ctx.server.legacy = False
+
+        assert self._action(tmp_path).execute(ctx) is True
+
+        sent = [c.args[0] for c in ctx.query_service.execute_non_processing.call_args_list]
+        executed_at = next(i for i, q in enumerate(sent) if q.startswith("EXEC [Main]"))
+        cleanup = sent[executed_at + 1 :]
+        assert any(q.startswith("DROP PROCEDURE") for q in cleanup)
+        assert any(q.startswith("DROP ASSEMBLY") for q in cleanup)
+        assert any("sp_drop_trusted_assembly" in q for q in cleanup)
+
+    def test_procedure_failure_drops_only_the_assembly(self, tmp_path):
+        ctx = MagicMock()
+        ctx.config_service.set_configuration_option.return_value = True
+        ctx.config_service.register_trusted_assembly.return_value = True
+        ctx.server.legacy = False
+
+        def execute(query, **kwargs):
+            if query.startswith("CREATE PROCEDURE"):
+                raise RuntimeError("denied")
+
+        ctx.query_service.execute_non_processing.side_effect = execute
+
+        assert self._action(tmp_path).execute(ctx) is False
+
+        sent = [c.args[0] for c in ctx.query_service.execute_non_processing.call_args_list]
+        failed_at = next(i for i, q in enumerate(sent) if q.startswith("CREATE PROCEDURE"))
+        cleanup = sent[failed_at + 1 :]
+        assert not any(q.startswith("DROP PROCEDURE") for q in cleanup)
+        assert any(q.startswith("DROP ASSEMBLY") for q in cleanup)
+        assert any("sp_drop_trusted_assembly" in q for q in cleanup)
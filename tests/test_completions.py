@@ -0,0 +1,37 @@
+# tests/test_completions.py
+
+"""Tests for the interactive shell's action completer."""
+
+from prompt_toolkit.document import Document
+
+from mssqlclient_ng.core.actions.factory import ActionFactory
+from mssqlclient_ng.core.utils.completions import ActionCompleter
+
+
+def _complete(completer: ActionCompleter, text: str) -> dict[str, str]:
+    return {
+        c.text: c.display_meta_text
+        for c in completer.get_completions(Document(text), None)
+    }
+
+
+class TestActionNameCompletion:
+    def test_prefix_matches_every_action_with_description(self):
+        completer = ActionCompleter()
+        expected = {
+            name[2:]: ActionFactory.get_action_description(name) or ""
+            for name in ActionFactory.list_actions()
+            if name.startswith("xp")
+        }
+
+        completions = _complete(completer, "!xp")
+
+        assert expected
+        assert {k: v for k, v in completions.items() if k in expected} == expected
+
+    def test_prefix_is_case_insensitive(self):
+        completer = ActionCompleter()
+        assert _complete(completer, "!WHOAM").keys() == _complete(completer, "!whoam").keys()
+
+    def test_unknown_prefix_yields_nothing(self):
+        assert _complete(ActionCompleter(), "!zzzz") == {}
@@ -0,0 +1,148 @@
+# tests/test_query_service.py
+
+"""Tests for QueryService state handling that does not need a live server."""
+
+import struct
+from unittest.mock import MagicMock, patch
+
+from impacket.tds import (
+    TDS_DONE72,
+    TDS_DONE_TOKEN,
+    TDS_DONEINPROC_TOKEN,
+    TDS_DONEPROC_TOKEN,
+)
+
+from mssqlclient_ng.core.actions.database.rolemembers import RoleMembers
+from mssqlclient_ng.core.models.linked_servers import LinkedServers
+from mssqlclient_ng.core.services.query import QueryService
+
+
+def _make_service() -> QueryService:
+    with (
+        patch.object(QueryService, "execute_scalar", return_value="SQL01\\INST"),
+        patch.object(QueryService, "get_current_database", return_value="master"),
+    ):
+        return QueryService(MagicMock())
+
+
+class TestExecutionServer:
+    def test_base_server_strips_instance_name(self):
+        service = _make_service()
+        assert service.execution_server == "SQL01"
+
+    def test_clearing_chain_reuses_base_server(self):
+        service = _make_service()
+        service.execution_server = "SQL02"
+
+        with (
+            patch.object(service, "execute_scalar") as scalar,
+            patch.object(service, "get_current_database", return_value="master"),
+        ):
+            service.linked_servers = LinkedServers()
+
+        scalar.assert_not_called()
+        assert service.execution_server == "SQL01"
+
+
+class TestExecuteScalar:
+    def test_requests_tuple_rows_and_returns_first_cell(self):
+        service = _make_service()
+        with patch.object(service, "execute", return_value=[["SQL01", 1]]) as execute:
+            assert service.execute_scalar("SELECT @@SERVERNAME, 1") == "SQL01"
+        assert execute.call_args.kwargs["tuple_mode"] is True
+
+    def test_no_rows_returns_none(self):
+        service = _make_service()
+        with patch.object(service, "execute", return_value=[]):
+            assert service.execute_scalar("SELECT 1 WHERE 1 = 0") is None
+
+
+class TestExecuteTable:
+    def test_returns_batch_rows_without_copying(self):
+        service = _make_service()
+        rows = [{"name": "master"}, {"name": "tempdb"}]
+        with patch.object(service, "execute", return_value=rows):
+            assert service.execute_table("SELECT name FROM sys.databases") is rows
+
+    def test_no_rows_returns_empty_list(self):
+        service = _make_service()
+        with patch.object(service, "execute", return_value=None):
+            assert service.execute_table("SELECT 1 WHERE 1 = 0") == []
+
+
+class TestAffectedRows:
+    @staticmethod
+    def _done(token_type: int, row_count: int):
+        return TDS_DONE72(bytes([token_type]) + struct.pack("<HHQ", 0x10, 0xC1, row_count))
+
+    def test_reads_row_count_from_done_token(self):
+        service = _make_service()
+        service.mssql_instance.replies = {TDS_DONE_TOKEN: [self._done(TDS_DONE_TOKEN, 7)]}
+        assert service._get_affected_rows() == 7
+
+    def test_inproc_count_wins_over_closing_doneproc(self):
+        service = _make_service()
+        service.mssql_instance.replies = {
+            TDS_DONEINPROC_TOKEN: [self._done(TDS_DONEINPROC_TOKEN, 3)],
+            TDS_DONEPROC_TOKEN: [self._done(TDS_DONEPROC_TOKEN, 0)],
+        }
+        assert service._get_affected_rows() == 3
+
+    def test_no_done_tokens_returns_zero(self):
+        service = _make_service()
+        service.mssql_instance.replies = {}
+        assert service._get_affected_rows() == 0
+
+
+# N'O''Brien' with every quote doubled once per hop
+_TWO_HOP_ROLE_LITERAL = "WHERE r.name = N" + "'" * 4 + "O" + "'" * 8 + "Brien" + "'" * 4 + "\n"
+
+
+class TestParameterize:
+    """Bound values use sp_executesql directly and plain literals through a chain."""
+
+    @staticmethod
+    def _chained_service(chain: str) -> QueryService:
+        service = _make_service()
+        with (
+            patch.object(service, "execute_scalar", return_value="SQL03"),
+            patch.object(service, "get_current_database", return_value="master"),
+        ):
+            service.linked_servers = LinkedServers(chain)
+        return service
+
+    @staticmethod
+    def _role_members_query(service: QueryService, role: str) -> str:
+        context = MagicMock()
+        context.query_service = service
+        action = RoleMembers()
+        action.validate_arguments(role)
+        with patch.object(service, "execute_table", return_value=[]) as execute_table:
+            action.execute(context)
+        return execute_table.call_args.args[0]
+
+    def test_direct_connection_uses_sp_executesql(self):
+        query = _make_service().parameterize("SELECT @n;", n="O'Brien")
+        assert query == (
+            "EXEC sp_executesql N'SELECT @n;', N'@n NVARCHAR(4000)', @n = N'O''Brien';"
+        )
+
+    def test_two_hop_openquery_inlines_the_value(self):
+        service = self._chained_service("SQL02;SQL03")
+        service.linked_servers.use_remote_procedure_call = False
+
+        final = service._prepare_query(self._role_members_query(service, "O'Brien"))
+
+        assert "sp_executesql" not in final
+        assert final.startswith("SELECT * FROM OPENQUERY([SQL02],'SELECT * FROM OPENQUERY([SQL03],''")
+        assert _TWO_HOP_ROLE_LITERAL in final
+
+    def test_two_hop_rpc_inlines_the_value(self):
+        service = self._chained_service("SQL02;SQL03")
+
+        final = service._prepare_query(self._role_members_query(service, "O'Brien"))
+
+        assert "sp_executesql" not in final
+        assert final.startswith("EXEC ('EXEC (''")
+        assert final.endswith("AT [SQL03];') AT [SQL02]")
+        assert _TWO_HOP_ROLE_LITERAL in final
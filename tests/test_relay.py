@@ -9,7 +9,7 @@ from unittest.mock import MagicMock, patch
 
 from impacket.examples.ntlmrelayx.attacks import PROTOCOL_ATTACKS
 
-from mssqlclient_ng.core.services.ntlmrelay import RelayMSSQL
+from mssqlclient_ng.core.services.ntlmrelay import CapturedClient, RelayMSSQL
 from mssqlclient_ng.core.models.server import Server
 
 
@@ -45,7 +45,7 @@ class TestAttackRegistration:
 
         # relay2 captured, relay was overwritten — documents the shared-global limitation
         assert relay2._captured_client is not None
-        assert relay2._captured_client["username"] == "victim"
+        assert relay2._captured_client.username == "victim"
 
 
 class TestWaitForConnection:
@@ -54,11 +54,9 @@ class TestWaitForConnection:
         def _fire():
             import time
             time.sleep(delay)
-            relay._captured_client = {
-                "client": MagicMock(),
-                "username": "admin",
-                "domain": "CORP",
-            }
+            relay._captured_client = CapturedClient(
+                client=MagicMock(), username="admin", domain="CORP"
+            )
             relay._capture_event.set()
 
         t = threading.Thread(target=_fire, daemon=True)
@@ -94,11 +92,9 @@ class TestWaitForConnection:
         def _fire():
             import time
             time.sleep(0.05)
-            relay._captured_client = {
-                "client": MagicMock(),
-                "username": "localadmin",
-                "domain": "",
-            }
+            relay._captured_client = CapturedClient(
+                client=MagicMock(), username="localadmin", domain=""
+            )
             relay._capture_event.set()
 
         threading.Thread(target=_fire, daemon=True).start()
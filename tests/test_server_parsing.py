@@ -160,6 +160,17 @@ class TestEdgeCases(unittest.TestCase):
             Server.parse_server("SQL01:0")
         self.assertIn("Port must be between 1 and 65535", str(ctx.exception))
 
+    def test_port_accepts_int_literal_forms(self):
+        """Test port parsing follows int(): signs and underscores are accepted."""
+        self.assertEqual(Server.parse_server("SQL01:+1433").port, 1433)
+        self.assertEqual(Server.parse_server("SQL01:1_433").port, 1433)
+
+    def test_negative_port_out_of_range(self):
+        """Test a negative port reports the range error."""
+        with self.assertRaises(ValueError) as ctx:
+            Server.parse_server("SQL01:-5")
+        self.assertIn("Port must be between 1 and 65535", str(ctx.exception))
+
     def test_empty_user(self):
         """Test parsing empty user is treated as no impersonation."""
         result = Server.parse_server("SQL01/")
@@ -172,6 +183,24 @@ class TestEdgeCases(unittest.TestCase):
         self.assertEqual(result.hostname, "SQL01")
         self.assertIsNone(result.database)  # Falls back to None
 
+    def test_version_drives_major_version_and_legacy(self):
+        """Test the major version is refreshed whenever the version changes."""
+        server = Server("SQL01")
+        self.assertEqual(server.major_version, 0)
+        self.assertFalse(server.legacy)
+
+        server.version = "13.00.5026"
+        self.assertEqual(server.major_version, 13)
+        self.assertTrue(server.legacy)
+
+        server.version = "16.00.1000"
+        self.assertEqual(server.major_version, 16)
+        self.assertFalse(server.legacy)
+
+        server.version = None
+        self.assertEqual(server.major_version, 0)
+        self.assertFalse(server.legacy)
+
 
 class TestLinkedServerChains(unittest.TestCase):
     """Test LinkedServers parsing with semicolon-separated chains."""
@@ -270,6 +299,72 @@ class TestLinkedServerChains(unittest.TestCase):
         self.assertEqual(len(chain.server_chain), 0)
         self.assertTrue(chain.is_empty)
 
+    def test_non_rpc_tracking_is_case_insensitive(self):
+        """Test RPC marks match server names regardless of case."""
+        chain = LinkedServers("SQL01;SQL02")
+        chain.mark_server_as_non_rpc("sql01")
+        self.assertTrue(chain.has_non_rpc_servers)
+        self.assertFalse(chain.all_servers_non_rpc)
+        chain.mark_server_as_non_rpc("Sql02")
+        self.assertTrue(chain.all_servers_non_rpc)
+
+
+class TestChainQueryBuilding(unittest.TestCase):
+    """Test the cached chain templates produce the same SQL as per-hop escaping."""
+
+    CHAINS = ["SQL02", "SQL02/sa;SQL03@db", "SQL02/a/b@x;SQL03;SQL04/c"]
+    QUERIES = ["SELECT 1", "SELECT 'it''s';", "EXEC xp_cmdshell 'whoami'"]
+
+    def test_rpc_chain_matches_recursive_builder(self):
+        for chain_input in self.CHAINS:
+            chain = LinkedServers(chain_input)
+            for query in self.QUERIES:
+                expected = LinkedServers._build_remote_procedure_call_recursive(
+                    linked_servers=chain._computable_server_names,
+                    query=query,
+                    linked_impersonation=chain._computable_impersonation_names,
+                    linked_databases=chain._computable_database_names,
+                )
+                self.assertEqual(chain.build_remote_procedure_call_chain(query), expected)
+
+    def test_openquery_chain_matches_recursive_builder(self):
+        for chain_input in self.CHAINS:
+            chain = LinkedServers(chain_input)
+            for query in self.QUERIES:
+                expected = chain._build_select_openquery_chain_recursive(
+                    linked_servers=chain._computable_server_names,
+                    query=query,
+                    linked_impersonation=chain._computable_impersonation_names,
+                    linked_databases=chain._computable_database_names,
+                )
+                self.assertEqual(chain.build_select_openquery_chain(query), expected)
+
+    def test_hybrid_chain_escapes_per_hop(self):
+        chain = LinkedServers("SQL02;SQL03")
+        chain.mark_server_as_non_rpc("SQL03")
+        self.assertEqual(
+            chain.build_hybrid_chain("SELECT 'x'"),
+            "EXEC ('SELECT * FROM OPENQUERY([SQL03], ''SELECT ''''x'''';'');') AT [SQL02]",
+        )
+
+    def test_template_follows_chain_changes(self):
+        chain = LinkedServers("SQL02")
+        self.assertEqual(
+            chain.build_remote_procedure_call_chain("SELECT 1"),
+            "EXEC ('SELECT 1;') AT [SQL02]",
+        )
+        chain.add_to_chain("SQL03")
+        self.assertEqual(
+            chain.build_remote_procedure_call_chain("SELECT 1"),
+            "EXEC ('EXEC (''SELECT 1;'') AT [SQL03];') AT [SQL02]",
+        )
+        chain.mark_server_as_non_rpc("SQL03")
+        self.assertIn("OPENQUERY([SQL03]", chain.build_hybrid_chain("SELECT 1"))
+
+    def test_empty_chain_returns_query_unchanged(self):
+        chain = LinkedServers()
+        self.assertEqual(chain.build_remote_procedure_call_chain("SELECT 1;"), "SELECT 1;")
+
 
 class TestBracketProtection(unittest.TestCase):
     """Test that brackets correctly protect special characters."""
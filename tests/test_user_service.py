@@ -0,0 +1,68 @@
+# tests/test_user_service.py
+
+"""Tests for UserService queries that do not need a live server."""
+
+from unittest.mock import MagicMock
+
+from mssqlclient_ng.core.services.user import UserService
+
+
+def _make_service(execute_table) -> UserService:
+    query_service = MagicMock()
+    query_service.execution_server = "SQL01"
+    query_service.execute_table.side_effect = execute_table
+    return UserService(query_service)
+
+
+class TestGetProfile:
+    def test_batch_rows_are_split_by_kind(self):
+        rows = [
+            {"Kind": "LOGIN", "Name": "CORP\\alice", "Flag": 0},
+            {"Kind": "USER", "Name": "dbo", "Flag": 0},
+            {"Kind": "SERVER_ROLE", "Name": "sysadmin", "Flag": 1},
+            {"Kind": "SERVER_ROLE", "Name": "auditors", "Flag": 0},
+            {"Kind": "DATABASE", "Name": "master", "Flag": 0},
+            {"Kind": "DATABASE_ROLE", "Name": "db_owner", "Flag": 0},
+        ]
+        service = _make_service(lambda query, **kwargs: rows)
+
+        profile = service.get_profile()
+
+        assert profile == {
+            "mapped_user": "dbo",
+            "system_user": "CORP\\alice",
+            "fixed_roles": ["sysadmin"],
+            "custom_roles": ["auditors"],
+            "databases": ["master"],
+            "database_roles": ["db_owner"],
+        }
+        assert (service.mapped_user, service.system_user) == ("dbo", "CORP\\alice")
+
+    def test_batch_populates_admin_cache(self):
+        rows = [{"Kind": "SERVER_ROLE", "Name": "sysadmin", "Flag": 1}]
+        service = _make_service(lambda query, **kwargs: rows)
+
+        service.get_profile()
+        service._query_service.execute_scalar.reset_mock()
+
+        assert service.is_admin() is True
+        service._query_service.execute_scalar.assert_not_called()
+
+    def test_failed_batch_falls_back_per_section(self):
+        def execute_table(query, **kwargs):
+            if "UNION ALL" in query:
+                raise RuntimeError("IS_ROLEMEMBER unavailable")
+            if "HAS_DBACCESS" in query:
+                return [{"name": "master"}, {"name": "tempdb"}]
+            raise RuntimeError("denied")
+
+        service = _make_service(execute_table)
+        service._query_service.execute.return_value = [{"U": "dbo", "S": "sa"}]
+
+        profile = service.get_profile()
+
+        assert profile["system_user"] == "sa"
+        assert profile["mapped_user"] == "dbo"
+        assert profile["databases"] == ["master", "tempdb"]
+        assert profile["fixed_roles"] == []
+        assert profile["database_roles"] == []
@@ -1,6 +1,6 @@
 # tests/test_utils.py
 
-"""Tests for utility functions in core/utils/common.py."""
+"""Tests for utility functions in core/utils/common.py and core/utils/lazy.py."""
 
 import pytest
 import gzip
@@ -17,7 +17,11 @@ from mssqlclient_ng.core.utils.common import (
     normalize_windows_path,
     convert_table_to_dicts,
     bracket_identifier,
+    quote_identifier,
+    sp_executesql,
+    inline_parameters,
 )
+from mssqlclient_ng.core.utils.lazy import make_getattr
 
 
 class TestGenerateRandomString:
@@ -149,3 +153,66 @@ class TestBracketIdentifier:
     def test_name_with_hyphen(self):
         # Hyphens should NOT trigger bracketing
         assert bracket_identifier("SQL-01") == "SQL-01"
+
+
+class TestQuoteIdentifier:
+    def test_plain_name(self):
+        assert quote_identifier("master") == "[master]"
+
+    def test_closing_bracket_doubled(self):
+        assert quote_identifier("evil]; DROP TABLE x;--") == "[evil]]; DROP TABLE x;--]"
+
+
+class TestSpExecutesql:
+    def test_statement_and_values_are_escaped(self):
+        query = sp_executesql(
+            "SELECT permission_name FROM fn_my_permissions(@obj, 'OBJECT');",
+            obj="[dbo].[O'Brien]",
+        )
+        assert query == (
+            "EXEC sp_executesql "
+            "N'SELECT permission_name FROM fn_my_permissions(@obj, ''OBJECT'');', "
+            "N'@obj NVARCHAR(4000)', @obj = N'[dbo].[O''Brien]';"
+        )
+
+    def test_multiple_parameters(self):
+        query = sp_executesql("SELECT @a, @b;", a="1", b="2")
+        assert "N'@a NVARCHAR(4000), @b NVARCHAR(4000)', @a = N'1', @b = N'2';" in query
+
+
+class TestInlineParameters:
+    def test_values_become_escaped_literals(self):
+        query = inline_parameters(
+            "SELECT 1 WHERE s.name = @schema AND o.name = @procedure;",
+            schema="dbo",
+            procedure="O'Brien",
+        )
+        assert query == "SELECT 1 WHERE s.name = N'dbo' AND o.name = N'O''Brien';"
+
+    def test_only_whole_parameter_names_are_replaced(self):
+        assert inline_parameters("SELECT @role, @roles;", role="x") == "SELECT N'x', @roles;"
+
+    def test_system_functions_are_left_alone(self):
+        query = inline_parameters("SELECT @@ROWCOUNT, @ROWCOUNT;", ROWCOUNT="x")
+        assert query == "SELECT @@ROWCOUNT, N'x';"
+
+
+class TestMakeGetattr:
+    def test_name_resolved_and_cached_on_package(self):
+        from mssqlclient_ng.core import models
+
+        vars(models).pop("Server", None)
+        server_class = models.Server
+        assert server_class.__name__ == "Server"
+        assert vars(models)["Server"] is server_class
+
+    def test_none_entry_resolves_submodule(self):
+        from mssqlclient_ng.core import actions
+
+        vars(actions).pop("agent", None)
+        assert actions.agent.__name__ == "mssqlclient_ng.core.actions.agent"
+
+    def test_unknown_name_raises_attribute_error(self):
+        getattr_ = make_getattr("mssqlclient_ng.core.models", {})
+        with pytest.raises(AttributeError, match="has no attribute 'Missing'"):
+            getattr_("Missing")